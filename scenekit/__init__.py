@@ -0,0 +1,3 @@
+# Render tooling shared by the visual-secrets and visual-ecc scenes.
+# Each tool is a module with its own command line:
+#     python -m scenekit.<tool> --help
@@ -0,0 +1,221 @@
+import argparse
+import json
+import platform
+import resource
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+from pathlib import Path
+
+from scenekit.loader import QUALITY
+
+SCENES = [
+    ("visual-secrets/scenes/visual_story.py", "VisualThresholdStory"),
+    ("visual-secrets/scenes/math_deep_dive.py", "MathDeepDive"),
+    ("visual-ecc/scene.py", "ZKP_Final_Narrative_V9"),
+]
+
+# Segments faster than this are too noisy to flag as regressions
+MIN_COMPARABLE_SECONDS = 0.25
+# Peak memory growth smaller than this is allocator noise
+MIN_COMPARABLE_MB = 8
+
+
+def _peak_rss_mb():
+    # ru_maxrss is in KiB on Linux
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def _count_mobjects(scene):
+    return sum(len(mob.get_family()) for mob in scene.mobjects)
+
+
+class SegmentRecorder:
+    # Splits one render into segments at every next_section call and every
+    # method listed in the scene's PARTS, counting frames as they are written.
+    def __init__(self, scene):
+        self.scene = scene
+        self.frames = 0
+        self.segments = []
+        self._current = None
+
+    def install(self):
+        scene, renderer = self.scene, self.scene.renderer
+        add_frame = renderer.add_frame
+
+        def counting_add_frame(frame, num_frames=1):
+            if not renderer.skip_animations:
+                self.frames += num_frames
+            add_frame(frame, num_frames)
+
+        renderer.add_frame = counting_add_frame
+
+        next_section = scene.next_section
+
+        def timed_next_section(name="unnamed", *args, **kwargs):
+            self.start(name)
+            next_section(name, *args, **kwargs)
+
+        scene.next_section = timed_next_section
+
+        for part in getattr(scene, "PARTS", []):
+            for method in part:
+                setattr(scene, method, self._timed(method, getattr(scene, method)))
+
+        construct = scene.construct
+
+        def timed_construct():
+            self.start("(start)")
+            construct()
+            self.stop()
+
+        scene.construct = timed_construct
+        return self
+
+    def _timed(self, name, method):
+        def timed(*args, **kwargs):
+            self.start(name)
+            return method(*args, **kwargs)
+        return timed
+
+    def start(self, name):
+        self.stop()
+        self._current = (name, time.perf_counter(), self.frames, _peak_rss_mb())
+
+    def stop(self):
+        if self._current is None:
+            return
+        name, began, frames, peak = self._current
+        self._current = None
+        wall = time.perf_counter() - began
+        frames = self.frames - frames
+        if name == "(start)" and frames == 0:
+            return
+        self.segments.append({
+            "name": name,
+            "wall_s": round(wall, 4),
+            "frames": frames,
+            "fps": round(frames / wall, 2) if wall else 0.0,
+            # ru_maxrss only ever grows, so a segment reports how far it
+            # raised the process peak; the scene total keeps the peak itself
+            "peak_growth_mb": round(_peak_rss_mb() - peak, 1),
+            "mobjects": _count_mobjects(self.scene),
+        })
+
+
+def _bench_scene(file, scene_name, quality):
+    # Runs in a fresh process so imports and peak memory are per scene
+    start = time.perf_counter()
+    from manim import tempconfig
+
+    from scenekit.loader import load_scene_class, render_config
+
+    with tempfile.TemporaryDirectory() as media_dir:
+        settings = render_config(
+            file, quality, media_dir=media_dir, renderer="cairo", disable_caching=True
+        )
+        with tempconfig(settings):
+            scene = load_scene_class(file, scene_name)()
+            recorder = SegmentRecorder(scene).install()
+            scene.render()
+    wall = time.perf_counter() - start
+
+    segments = {}
+    for segment in recorder.segments:
+        name = segment.pop("name")
+        while name in segments:
+            name += "'"
+        segments[name] = segment
+    return {
+        "wall_s": round(wall, 4),
+        "frames": recorder.frames,
+        "fps": round(recorder.frames / wall, 2),
+        "peak_rss_mb": round(_peak_rss_mb(), 1),
+        "mobjects": max((s["mobjects"] for s in segments.values()), default=0),
+        "segments": segments,
+    }
+
+
+def run(scenes=SCENES, quality="l"):
+    import manim
+
+    results = {
+        "meta": {
+            "manim": manim.__version__,
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+            "quality": QUALITY[quality],
+        },
+        "scenes": {},
+    }
+    for file, scene_name in scenes:
+        with ProcessPoolExecutor(max_workers=1, mp_context=get_context("spawn")) as pool:
+            results["scenes"][scene_name] = pool.submit(_bench_scene, file, scene_name, quality).result()
+    return results
+
+
+def compare(current, baseline, threshold):
+    # Human readable regressions of wall time and peak memory
+    regressions = []
+
+    def check(label, new, old):
+        for metric in ("wall_s", "peak_rss_mb", "peak_growth_mb"):
+            if metric not in new or metric not in old:
+                continue
+            if metric == "wall_s" and old[metric] < MIN_COMPARABLE_SECONDS:
+                continue
+            if metric == "peak_growth_mb" and new[metric] - old[metric] < MIN_COMPARABLE_MB:
+                continue
+            if new[metric] > old[metric] * (1 + threshold):
+                change = f"+{new[metric] / old[metric] - 1:.0%}" if old[metric] else "new"
+                regressions.append(f"{label} {metric}: {old[metric]} -> {new[metric]} ({change})")
+
+    for scene_name, result in current["scenes"].items():
+        old = baseline["scenes"].get(scene_name)
+        if old is None:
+            continue
+        check(scene_name, result, old)
+        for name, segment in result["segments"].items():
+            if name in old["segments"]:
+                check(f"{scene_name}/{name}", segment, old["segments"][name])
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Render every scene headless at a fixed quality and compare against a baseline."
+    )
+    parser.add_argument("--scene", action="append", metavar="FILE:CLASS",
+                        help="scene to benchmark (repeatable, default: all three scenes)")
+    parser.add_argument("-q", "--quality", choices=QUALITY, default="l")
+    parser.add_argument("--save", help="write results JSON here (e.g. a new baseline)")
+    parser.add_argument("--baseline", help="baseline JSON to compare against")
+    parser.add_argument("--threshold", type=float, default=0.15,
+                        help="allowed slowdown / memory growth, as a fraction (default 0.15)")
+    args = parser.parse_args(argv)
+
+    scenes = [tuple(spec.rsplit(":", 1)) for spec in args.scene] if args.scene else SCENES
+    results = run(scenes, args.quality)
+
+    for scene_name, result in results["scenes"].items():
+        print(f"{scene_name}: {result['wall_s']:.2f}s, {result['frames']} frames, "
+              f"{result['fps']:.1f} fps, {result['peak_rss_mb']:.0f} MB peak")
+        for name, segment in result["segments"].items():
+            print(f"    {name:<28} {segment['wall_s']:7.2f}s {segment['fps']:7.1f} fps "
+                  f"{segment['mobjects']:6d} mobjects {segment['peak_growth_mb']:+7.1f} MB peak")
+
+    if args.save:
+        Path(args.save).write_text(json.dumps(results, indent=2))
+
+    if args.baseline:
+        regressions = compare(results, json.loads(Path(args.baseline).read_text()), args.threshold)
+        for line in regressions:
+            print(f"REGRESSION {line}")
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
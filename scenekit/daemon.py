@@ -0,0 +1,227 @@
+import argparse
+import json
+import os
+import signal
+import socket
+import sys
+import tempfile
+import time
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from scenekit.loader import QUALITY, load_scene_class, render_config
+
+# manim is only imported by the daemon, so the client starts in milliseconds
+SOCKET = Path(tempfile.gettempdir()) / f"scenekit-render-{os.getuid()}.sock"
+
+
+def warm_up():
+    # Pays the one-off costs before the first job: importing manim and the
+    # shared scenekit helpers, font discovery and Pango setup for Text, and
+    # renderer and camera construction. Forked jobs inherit all of it.
+    start = time.perf_counter()
+    from manim import Scene, Text, tempconfig
+
+    import scenekit.geometry_cache
+    import scenekit.glyphs
+    import scenekit.pointcloud
+
+    with tempconfig({"write_to_movie": False, "disable_caching": True, "verbosity": "WARNING"}):
+        Text("warm up 0123456789 %()")
+        Scene()
+    return time.perf_counter() - start
+
+
+def _send(conn, message):
+    conn.sendall(json.dumps(message).encode() + b"\n")
+
+
+def _receive(conn):
+    data = b""
+    while not data.endswith(b"\n"):
+        chunk = conn.recv(65536)
+        if not chunk:
+            break
+        data += chunk
+    return json.loads(data) if data else None
+
+
+def _run_job(conn, job, accepted):
+    # Runs in a forked child: fresh scene module, warm everything else.
+    # Config changes and imported scene code die with the child.
+    from manim import tempconfig
+
+    forked = time.perf_counter()
+    try:
+        os.chdir(job.get("cwd", os.getcwd()))
+        overrides = {"progress_bar": "none", "verbosity": "WARNING", **job.get("overrides", {})}
+        with tempconfig(render_config(job["file"], job.get("quality", "l"), **overrides)):
+            scene = load_scene_class(job["file"], job["scene"])()
+            loaded = time.perf_counter()
+            scene.render()
+            done = time.perf_counter()
+            movie = scene.renderer.file_writer.movie_file_path
+        _send(conn, {
+            "ok": True,
+            "movie": str(movie) if movie else None,
+            "queued_ms": 1000 * (forked - accepted),
+            "setup_ms": 1000 * (loaded - forked),
+            "render_ms": 1000 * (done - loaded),
+        })
+    except BaseException:
+        _send(conn, {"ok": False, "error": traceback.format_exc()})
+
+
+def serve(path=SOCKET, jobs=None):
+    # Accepts newline-terminated JSON jobs on a Unix socket and renders each
+    # one in a child forked from this warm process. Up to jobs renders run at
+    # once; further connections wait in the accept backlog.
+    jobs = jobs or os.cpu_count()
+    path = Path(path)
+    if path.exists():
+        path.unlink()
+    warm = warm_up()
+    import manim
+
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    server.bind(str(path))
+    server.listen(64)
+    print(f"manim {manim.__version__} warm in {warm:.2f}s, listening on {path} ({jobs} jobs)", flush=True)
+
+    children = set()
+    try:
+        while True:
+            while len(children) >= jobs:
+                children.discard(os.wait()[0])
+            conn, _ = server.accept()
+            accepted = time.perf_counter()
+            with conn:
+                # A malformed job or a client that hung up must not take the
+                # warm daemon down with it
+                try:
+                    job = _receive(conn)
+                    if job is None:
+                        continue
+                    if not isinstance(job, dict):
+                        raise ValueError(f"expected a JSON object, got {type(job).__name__}")
+                    if job.get("command") == "ping":
+                        _send(conn, {"ok": True, "pid": os.getpid(), "running": len(children)})
+                        continue
+                    if job.get("command") == "shutdown":
+                        _send(conn, {"ok": True})
+                        break
+                except OSError:
+                    continue
+                except ValueError as error:
+                    try:
+                        _send(conn, {"ok": False, "error": f"bad request: {error}"})
+                    except OSError:
+                        pass
+                    continue
+                pid = os.fork()
+                if pid == 0:
+                    server.close()
+                    signal.signal(signal.SIGINT, signal.SIG_DFL)
+                    code = 0
+                    try:
+                        _run_job(conn, job, accepted)
+                    except BaseException:
+                        code = 1
+                    finally:
+                        conn.close()
+                        os._exit(code)
+                children.add(pid)
+            # Reap jobs that finished meanwhile
+            while children:
+                pid, _ = os.waitpid(-1, os.WNOHANG)
+                if pid == 0:
+                    break
+                children.discard(pid)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.close()
+        path.unlink(missing_ok=True)
+        for pid in children:
+            os.waitpid(pid, 0)
+
+
+def request(message, path=SOCKET):
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as conn:
+        conn.connect(str(path))
+        _send(conn, message)
+        return _receive(conn)
+
+
+def render(file, scene, quality="l", path=SOCKET, **overrides):
+    # Client side: one render job on the daemon. Adds the round trip and the
+    # daemon overhead (everything but scene.render itself) to the reply.
+    start = time.perf_counter()
+    reply = request({
+        "file": str(Path(file).resolve()),
+        "scene": scene,
+        "quality": quality,
+        "cwd": os.getcwd(),
+        "overrides": overrides,
+    }, path)
+    reply["total_ms"] = 1000 * (time.perf_counter() - start)
+    if reply.get("ok"):
+        reply["overhead_ms"] = reply["total_ms"] - reply["render_ms"]
+    return reply
+
+
+def _parse_override(text):
+    key, _, value = text.partition("=")
+    try:
+        return key, json.loads(value)
+    except json.JSONDecodeError:
+        return key, value
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Warm render daemon and its client.")
+    parser.add_argument("--socket", default=str(SOCKET), help=f"Unix socket path (default {SOCKET})")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    serve_cmd = commands.add_parser("serve", help="start the daemon in the foreground")
+    serve_cmd.add_argument("-j", "--jobs", type=int, help="concurrent renders (default: CPU count)")
+
+    render_cmd = commands.add_parser("render", help="render one or more scenes through the daemon")
+    render_cmd.add_argument("file", help="scene file, e.g. visual-secrets/scenes/threshold_story.py")
+    render_cmd.add_argument("scenes", nargs="+", help="scene classes, e.g. ThresholdStory")
+    render_cmd.add_argument("-q", "--quality", choices=QUALITY, default="l")
+    render_cmd.add_argument("--set", action="append", default=[], metavar="KEY=VALUE",
+                            help="extra manim config, e.g. --set frame_rate=30 (repeatable)")
+
+    commands.add_parser("ping", help="check that the daemon is up")
+    commands.add_parser("stop", help="shut the daemon down")
+    args = parser.parse_args(argv)
+
+    if args.command == "serve":
+        serve(args.socket, args.jobs)
+    elif args.command == "render":
+        overrides = dict(_parse_override(item) for item in args.set)
+        # All scenes are submitted at once; the daemon runs up to --jobs of them
+        with ThreadPoolExecutor(max_workers=len(args.scenes)) as pool:
+            replies = list(pool.map(
+                lambda scene: render(args.file, scene, args.quality, args.socket, **overrides),
+                args.scenes,
+            ))
+        failed = False
+        for scene, reply in zip(args.scenes, replies):
+            if not reply.get("ok"):
+                failed = True
+                print(f"{scene}: failed\n{reply.get('error')}", file=sys.stderr)
+                continue
+            print(f"{scene}: {reply['total_ms']:.0f} ms total, {reply['render_ms']:.0f} ms rendering, "
+                  f"{reply['overhead_ms']:.0f} ms overhead (queued {reply['queued_ms']:.0f}, "
+                  f"setup {reply['setup_ms']:.0f}): {reply['movie']}")
+        if failed:
+            sys.exit(1)
+    else:
+        print(request({"command": "ping" if args.command == "ping" else "shutdown"}, args.socket))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+import argparse
+import threading
+import time
+
+from manim import tempconfig
+from manim.utils.exceptions import EndSceneEarlyException
+
+from scenekit.loader import QUALITY, load_scene_class, render_config
+
+
+def scene_frames(file, scene_name, quality="l", **overrides):
+    # Render a scene in-process and yield every frame as a read-only
+    # (height, width, 4) uint8 RGBA view of the camera's pixel buffer.
+    # Nothing is copied, encoded or written to disk: the renderer thread
+    # pauses after each frame until the consumer asks for the next one, so a
+    # frame is only valid until the following iteration. Copy it to keep it.
+    # Held frames (self.wait) yield the same buffer repeatedly.
+    settings = render_config(
+        file, quality, write_to_movie=False, save_last_frame=False, disable_caching=True, **overrides
+    )
+    ready = threading.Semaphore(0)
+    consumed = threading.Semaphore(0)
+    state = {"frame": None, "finished": False, "cancelled": False, "error": None}
+
+    def produce():
+        try:
+            with tempconfig(settings):
+                scene = load_scene_class(file, scene_name)()
+                renderer = scene.renderer
+
+                def add_frame(frame, num_frames=1):
+                    if renderer.skip_animations:
+                        return
+                    renderer.time += num_frames / renderer.camera.frame_rate
+                    view = frame.view()
+                    view.flags.writeable = False
+                    for _ in range(num_frames):
+                        state["frame"] = view
+                        ready.release()
+                        consumed.acquire()
+                        if state["cancelled"]:
+                            raise EndSceneEarlyException()
+
+                # CairoRenderer.get_frame returns a copy of the pixel array.
+                # It stays untouched (save_static_frame_data keeps its result
+                # as the background to reset to); only the two callers that
+                # pass frames on to add_frame hand over the live buffer.
+                def render(scene, time, moving_mobjects):
+                    renderer.update_frame(scene, moving_mobjects)
+                    add_frame(renderer.camera.pixel_array)
+
+                def freeze_current_frame(duration):
+                    dt = 1 / renderer.camera.frame_rate
+                    add_frame(renderer.camera.pixel_array, num_frames=int(duration / dt))
+
+                renderer.add_frame = add_frame
+                renderer.render = render
+                renderer.freeze_current_frame = freeze_current_frame
+                scene.render()
+        except BaseException as error:
+            state["error"] = error
+        finally:
+            state["finished"] = True
+            ready.release()
+
+    thread = threading.Thread(target=produce, name="scene-frames", daemon=True)
+    thread.start()
+    try:
+        while True:
+            ready.acquire()
+            if state["finished"]:
+                break
+            yield state["frame"]
+            consumed.release()
+    finally:
+        # Consumer stopped early: let the scene end at its current frame
+        if not state["finished"]:
+            state["cancelled"] = True
+            consumed.release()
+        thread.join()
+    if state["error"] is not None:
+        raise state["error"]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Stream a scene's frames in-process and report throughput (no encoding, no disk I/O)."
+    )
+    parser.add_argument("file")
+    parser.add_argument("scene")
+    parser.add_argument("-q", "--quality", choices=QUALITY, default="l")
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    count, shape = 0, None
+    for frame in scene_frames(args.file, args.scene, args.quality):
+        count += 1
+        shape = frame.shape
+    wall = time.perf_counter() - start
+    print(f"{count} frames of {shape} in {wall:.2f}s ({count / wall:.1f} fps)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,128 @@
+import hashlib
+import inspect
+import json
+import os
+import types
+from pathlib import Path
+
+import manim
+import numpy as np
+from manim import VGroup, VMobject, config
+
+# Per-mobject style arrays stored next to the points
+STYLE_ARRAYS = ["fill_rgbas", "stroke_rgbas", "background_stroke_rgbas"]
+STYLE_VALUES = ["stroke_width", "background_stroke_width", "z_index"]
+
+
+def _hash_code(digest, code):
+    # Bytecode, referenced names and constants of a function, nested
+    # functions and lambdas included. Helpers it calls are not followed.
+    digest.update(code.co_code)
+    digest.update(repr(code.co_names).encode())
+    for const in code.co_consts:
+        if isinstance(const, types.CodeType):
+            _hash_code(digest, const)
+        else:
+            digest.update(repr(const).encode())
+
+
+class GeometryCache:
+    # Persistent store of constructed VMobject geometry keyed by a name, the
+    # builder's code and the constructor parameters. Each entry is one .npy holding every point
+    # of the mobject family plus a small JSON index of slices and styles.
+    # Loads memory-map the .npy copy-on-write, so boolean ops and curve
+    # construction are skipped and the points are only paged in when drawn.
+    # Entries are evicted least-recently-used once the folder exceeds
+    # max_bytes.
+    def __init__(self, root=None, max_bytes=256 * 2**20):
+        self._root = Path(root) if root else None
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def root(self):
+        root = self._root or Path(config.media_dir) / "geometry_cache"
+        root.mkdir(parents=True, exist_ok=True)
+        return root
+
+    def key(self, name, build, params):
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(repr((manim.__version__, name, sorted(params.items()))).encode())
+        # Editing the builder (a colour, a size) must not load old geometry
+        _hash_code(digest, inspect.unwrap(build).__code__)
+        return f"{name}-{digest.hexdigest()}"
+
+    def get(self, name, build, **params):
+        # Cached geometry of build(**params); params must have stable reprs
+        key = self.key(name, build, params)
+        index_path = self.root / f"{key}.json"
+        if index_path.exists():
+            self.hits += 1
+            for path in (index_path, index_path.with_suffix(".npy")):
+                os.utime(path)
+            return self._load(key)
+
+        self.misses += 1
+        mob = build(**params)
+        self._store(key, mob)
+        self._evict()
+        return mob
+
+    def _store(self, key, mob):
+        members, chunks, offset = [], [], 0
+        for sub in mob.get_family():
+            if len(sub.points) == 0:
+                continue
+            member = {"start": offset, "stop": offset + len(sub.points)}
+            for attr in STYLE_ARRAYS:
+                member[attr] = np.asarray(getattr(sub, attr)).tolist()
+            for attr in STYLE_VALUES:
+                member[attr] = float(getattr(sub, attr))
+            members.append(member)
+            chunks.append(sub.points)
+            offset += len(sub.points)
+
+        points = np.concatenate(chunks) if chunks else np.zeros((0, 3))
+        # Write to temporary names first so readers never see half an entry
+        tmp_npy = self.root / f"{key}.tmp.npy"
+        tmp_json = self.root / f"{key}.tmp.json"
+        np.save(tmp_npy, points)
+        tmp_json.write_text(json.dumps(members))
+        tmp_npy.replace(self.root / f"{key}.npy")
+        tmp_json.replace(self.root / f"{key}.json")
+
+    def _load(self, key):
+        points = np.load(self.root / f"{key}.npy", mmap_mode="c")
+        members = json.loads((self.root / f"{key}.json").read_text())
+        mobs = []
+        for member in members:
+            mob = VMobject()
+            # Assign the slice directly: set_points() would copy it
+            mob.points = points[member["start"]:member["stop"]]
+            for attr in STYLE_ARRAYS:
+                setattr(mob, attr, np.array(member[attr]))
+            for attr in STYLE_VALUES:
+                setattr(mob, attr, member[attr])
+            mobs.append(mob)
+        return mobs[0] if len(mobs) == 1 else VGroup(*mobs)
+
+    def _evict(self):
+        entries = []
+        for index_path in self.root.glob("*.json"):
+            if index_path.name.endswith(".tmp.json"):
+                continue
+            npy = index_path.with_suffix(".npy")
+            if npy.exists():
+                size = index_path.stat().st_size + npy.stat().st_size
+                entries.append((npy.stat().st_mtime, size, index_path, npy))
+        total = sum(size for _, size, _, _ in entries)
+        for _, size, index_path, npy in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            index_path.unlink(missing_ok=True)
+            npy.unlink(missing_ok=True)
+            total -= size
+
+
+geometry_cache = GeometryCache()
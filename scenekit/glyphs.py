@@ -0,0 +1,117 @@
+import time
+from collections import OrderedDict, namedtuple
+
+import numpy as np
+from manim import DOWN, LEFT, RIGHT, Text, VGroup
+
+TextStats = namedtuple(
+    "TextStats",
+    ["hits", "misses", "entries", "bytes", "build_seconds", "saved_seconds"],
+)
+
+
+def _mobject_bytes(mob):
+    total = 0
+    for sub in mob.get_family():
+        total += sub.points.nbytes
+        for attr in ("stroke_rgbas", "fill_rgbas", "background_stroke_rgbas"):
+            rgbas = getattr(sub, attr, None)
+            if rgbas is not None:
+                total += rgbas.nbytes
+    return total
+
+
+class TextFactory:
+    # Memoizes shaped Text mobjects by (string, font, size, colour and any other
+    # Text options). The first request pays for Pango shaping and SVG path
+    # conversion; repeats get a copy of the cached glyph geometry. Entries are
+    # evicted least-recently-used once their point data exceeds max_bytes.
+    def __init__(self, max_bytes=64 * 2**20):
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.build_seconds = 0.0
+        self.saved_seconds = 0.0
+        self._entries = OrderedDict()
+        self._bytes = 0
+
+    def text(self, string, **kwargs):
+        key = (string, tuple(sorted((k, repr(v)) for k, v in kwargs.items())))
+        entry = self._entries.get(key)
+        if entry is not None:
+            self.hits += 1
+            self._entries.move_to_end(key)
+            mob, build_time, _ = entry
+            start = time.perf_counter()
+            copy = mob.copy()
+            self.saved_seconds += build_time - (time.perf_counter() - start)
+            return copy
+
+        self.misses += 1
+        start = time.perf_counter()
+        mob = Text(string, **kwargs)
+        build_time = time.perf_counter() - start
+        self.build_seconds += build_time
+
+        size = _mobject_bytes(mob)
+        self._entries[key] = (mob, build_time, size)
+        self._bytes += size
+        while self._bytes > self.max_bytes and len(self._entries) > 1:
+            _, (_, _, evicted) = self._entries.popitem(last=False)
+            self._bytes -= evicted
+        return mob.copy()
+
+    def stats(self):
+        return TextStats(
+            self.hits, self.misses, len(self._entries), self._bytes,
+            self.build_seconds, self.saved_seconds,
+        )
+
+    def clear(self):
+        self.hits = 0
+        self.misses = 0
+        self.build_seconds = 0.0
+        self.saved_seconds = 0.0
+        self._entries.clear()
+        self._bytes = 0
+
+
+# One factory per process, so a render that builds several scenes (manim -a,
+# the PARTS scenes of a preview) shares labels across all of them. A single
+# scene only repeats a couple of labels; the cache is bounded by max_bytes
+# and dies with the forked preview/daemon child, so it costs little more.
+text_factory = TextFactory()
+cached_text = text_factory.text
+
+
+class GlyphSet:
+    # Shapes a small character set once and composes strings from copies of
+    # the glyphs, for labels that change every round (counters, percentages).
+    # Composing costs a few point-array copies instead of a Pango pass, and
+    # nothing new lands in the text cache. Glyphs keep their vertical place
+    # from the shaped string and are spaced by their own width plus the
+    # median gap Pango left between them.
+    def __init__(self, charset, **kwargs):
+        chars = [c for c in dict.fromkeys(charset) if not c.isspace()]
+        shaped = Text("".join(chars), **kwargs)
+        bottom = shaped.get_bottom()[1]
+        gaps = [b.get_left()[0] - a.get_right()[0] for a, b in zip(shaped[:-1], shaped[1:])]
+        self.gap = float(np.median(gaps)) if gaps else 0.0
+        self.space = float(np.median([g.width for g in shaped])) * 0.6
+        self.glyphs = {}
+        for char, glyph in zip(chars, shaped):
+            # Left edge at x = 0, the bottom of the shaped string at y = 0
+            glyph.shift(LEFT * glyph.get_left()[0] + DOWN * bottom)
+            self.glyphs[char] = glyph
+
+    def compose(self, string):
+        row = VGroup()
+        x = 0.0
+        for char in string:
+            if char.isspace():
+                x += self.space
+                continue
+            glyph = self.glyphs[char].copy().shift(RIGHT * x)
+            row.add(glyph)
+            x += glyph.width + self.gap
+        return row
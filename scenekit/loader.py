@@ -0,0 +1,66 @@
+import hashlib
+import importlib.util
+import sys
+from pathlib import Path
+
+import numpy as np
+
+
+def load_scene_class(path, name):
+    # Import a scene file the way the manim CLI does: its folder goes on
+    # sys.path so sibling helper modules (shamir_field, plotting...) resolve.
+    path = Path(path).resolve()
+    if str(path.parent) not in sys.path:
+        sys.path.insert(0, str(path.parent))
+    spec = importlib.util.spec_from_file_location(path.stem, path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return getattr(module, name)
+
+
+def local_sources_digest(path):
+    # Hash of every module imported from the scene's own folder, so editing a
+    # helper like plotting.py invalidates anything keyed on the scene code.
+    # The scene file itself is left out: callers fingerprint the parts of it
+    # they depend on (see scenekit.sections.context_fingerprint).
+    path = Path(path).resolve()
+    digest = hashlib.blake2b(digest_size=16)
+    files = {
+        Path(module.__file__).resolve()
+        for module in list(sys.modules.values())
+        if getattr(module, "__file__", None)
+        and Path(module.__file__).resolve().parent == path.parent
+    } - {path}
+    for file in sorted(files):
+        digest.update(file.read_bytes())
+    return digest.hexdigest()
+
+
+def mobject_digest(mobjects):
+    # Hash of geometry and style for every mobject in the given families
+    digest = hashlib.blake2b(digest_size=16)
+    for root in mobjects:
+        for mob in root.get_family():
+            digest.update(type(mob).__name__.encode())
+            digest.update(np.ascontiguousarray(mob.points, dtype=float).tobytes())
+            for getter in ("get_stroke_rgbas", "get_fill_rgbas"):
+                if hasattr(mob, getter):
+                    digest.update(np.asarray(getattr(mob, getter)(), dtype=float).tobytes())
+            digest.update(repr((getattr(mob, "stroke_width", None), mob.z_index)).encode())
+    return digest.hexdigest()
+
+
+# manim -q flags
+QUALITY = {
+    "l": "low_quality",
+    "m": "medium_quality",
+    "h": "high_quality",
+    "p": "production_quality",
+    "k": "fourk_quality",
+}
+
+
+def render_config(path, quality="l", **overrides):
+    # tempconfig() settings matching `manim -q<quality> <path>`
+    return {"input_file": str(path), "quality": QUALITY[quality], **overrides}
@@ -0,0 +1,56 @@
+import argparse
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from manim import tempconfig
+from manim.scene.scene_file_writer import SceneFileWriter
+
+from scenekit.loader import QUALITY, load_scene_class, render_config
+
+
+def _render_part(file, scene_name, index, quality):
+    # Worker: render PARTS[index] as its own scene class. The distinct class
+    # name keeps each worker's partial movie folder separate.
+    with tempconfig(render_config(file, quality)):
+        scene_cls = load_scene_class(file, scene_name)
+        part_cls = type(f"{scene_name}_Part{index}", (scene_cls,), {"parts": [index]})
+        scene = part_cls()
+        scene.render()
+        return str(scene.renderer.file_writer.movie_file_path)
+
+
+def render_parallel(file, scene_name, quality="l", jobs=None):
+    # Render every part of a scene with a PARTS list (see
+    # ZKP_Final_Narrative_V9) in a process pool, then join the part movies in
+    # order into the file `manim <file> <scene_name>` would have written.
+    with tempconfig(render_config(file, quality)):
+        num_parts = len(load_scene_class(file, scene_name).PARTS)
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            futures = [
+                pool.submit(_render_part, file, scene_name, index, quality)
+                for index in range(num_parts)
+            ]
+            part_movies = [future.result() for future in futures]
+
+        writer = SceneFileWriter(None, scene_name)
+        writer.combine_files(part_movies, writer.movie_file_path)
+        return writer.movie_file_path
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Render the independent PARTS of a scene on all cores and join them."
+    )
+    parser.add_argument("file", help="scene file, e.g. visual-ecc/scene.py")
+    parser.add_argument("scene", help="scene class, e.g. ZKP_Final_Narrative_V9")
+    parser.add_argument("-q", "--quality", choices=QUALITY, default="l")
+    parser.add_argument("-j", "--jobs", type=int, help="worker processes (default: CPU count)")
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    movie = render_parallel(args.file, args.scene, args.quality, args.jobs)
+    print(f"Rendered in {time.perf_counter() - start:.1f}s: {movie}")
+
+
+if __name__ == "__main__":
+    main()
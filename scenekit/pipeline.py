@@ -0,0 +1,176 @@
+import argparse
+import inspect
+import queue
+import threading
+import time
+from collections import namedtuple
+
+import numpy as np
+from manim import tempconfig
+
+from scenekit.loader import QUALITY, load_scene_class, render_config
+
+PipelineStats = namedtuple(
+    "PipelineStats",
+    ["frames", "buffers", "mean_depth", "max_depth", "raster_stall_s", "encoder_idle_s", "wall_s"],
+)
+
+
+class EncodePipeline:
+    # Runs the video encoder on its own thread, fed through a bounded pool of
+    # reusable frame buffers. The renderer copies each finished frame into a
+    # free buffer and goes straight on to the next one while the encoder
+    # drains the queue; when all buffers are in flight the renderer waits, so
+    # memory stays at depth frames however long the scene is. A hold such as
+    # self.wait(4) is one buffer written num_frames times.
+    # The queue is drained before every partial movie is closed, so the
+    # output is identical to an unpipelined render.
+    def __init__(self, scene, depth=8):
+        self.scene = scene
+        self.depth = depth
+        self.frames = 0
+        self.raster_stall = 0.0
+        self.encoder_idle = 0.0
+        self.max_depth = 0
+        self._depth_total = 0
+        self._puts = 0
+        self._buffers = 0
+        self._free = queue.Queue()
+        self._filled = queue.Queue()
+        self._thread = None
+        self._error = None
+        self._start = None
+
+    def install(self):
+        renderer = self.scene.renderer
+        writer = renderer.file_writer
+        write_frame = writer.write_frame
+        if "num_frames" in inspect.signature(write_frame).parameters:
+            self._write = lambda frame, n: write_frame(frame, num_frames=n)
+        else:
+            self._write = lambda frame, n: [write_frame(frame) for _ in range(n)]
+
+        renderer.add_frame = self._add_frame
+
+        end_animation = writer.end_animation
+        finish = writer.finish
+
+        def flushed_end_animation(*args, **kwargs):
+            self.flush()
+            return end_animation(*args, **kwargs)
+
+        def flushed_finish(*args, **kwargs):
+            self.close()
+            return finish(*args, **kwargs)
+
+        writer.end_animation = flushed_end_animation
+        writer.finish = flushed_finish
+        return self
+
+    # --- RASTERIZER SIDE ---
+    def _add_frame(self, frame, num_frames=1):
+        renderer = self.scene.renderer
+        if renderer.skip_animations:
+            return
+        renderer.time += num_frames / renderer.camera.frame_rate
+        self._check()
+        if self._thread is None:
+            self._start = time.perf_counter()
+            self._thread = threading.Thread(target=self._encode, name="scenekit-encoder", daemon=True)
+            self._thread.start()
+
+        buffer = self._acquire(frame)
+        np.copyto(buffer, frame)
+        self._filled.put((buffer, num_frames))
+        self.frames += num_frames
+
+        depth = self._filled.qsize()
+        self._depth_total += depth
+        self._puts += 1
+        self.max_depth = max(self.max_depth, depth)
+
+    def _acquire(self, frame):
+        try:
+            return self._free.get_nowait()
+        except queue.Empty:
+            pass
+        if self._buffers < self.depth:
+            self._buffers += 1
+            return np.empty_like(frame)
+        start = time.perf_counter()
+        buffer = self._free.get()
+        self.raster_stall += time.perf_counter() - start
+        return buffer
+
+    def _check(self):
+        if self._error is not None:
+            error, self._error = self._error, None
+            raise error
+
+    def flush(self):
+        # Wait until every queued frame has been handed to the encoder
+        self._filled.join()
+        self._check()
+
+    def close(self):
+        if self._thread is not None:
+            self._filled.put(None)
+            self._thread.join()
+            self._thread = None
+        self._check()
+
+    # --- ENCODER SIDE ---
+    def _encode(self):
+        while True:
+            start = time.perf_counter()
+            item = self._filled.get()
+            self.encoder_idle += time.perf_counter() - start
+            try:
+                if item is None:
+                    return
+                buffer, num_frames = item
+                if self._error is None:
+                    try:
+                        self._write(buffer, num_frames)
+                    except BaseException as error:
+                        self._error = error
+                self._free.put(buffer)
+            finally:
+                self._filled.task_done()
+
+    def stats(self):
+        wall = time.perf_counter() - self._start if self._start else 0.0
+        mean_depth = self._depth_total / self._puts if self._puts else 0.0
+        return PipelineStats(
+            self.frames, self._buffers, mean_depth, self.max_depth,
+            self.raster_stall, self.encoder_idle, wall,
+        )
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Render a scene with rasterization and encoding on separate threads and report queue stats."
+    )
+    parser.add_argument("file", help="scene file, e.g. visual-ecc/scene.py")
+    parser.add_argument("scene", help="scene class, e.g. ZKP_Final_Narrative_V9")
+    parser.add_argument("-q", "--quality", choices=QUALITY, default="l")
+    parser.add_argument("--depth", type=int, default=8, help="frame buffers in flight (default 8)")
+    args = parser.parse_args(argv)
+
+    with tempconfig(render_config(args.file, args.quality)):
+        scene = load_scene_class(args.file, args.scene)()
+        pipeline = EncodePipeline(scene, args.depth).install()
+        start = time.perf_counter()
+        scene.render()
+        wall = time.perf_counter() - start
+        stats = pipeline.stats()
+
+    print(f"{stats.frames} frames in {wall:.2f}s ({stats.frames / wall:.1f} fps): "
+          f"{scene.renderer.file_writer.movie_file_path}")
+    print(f"queue depth mean {stats.mean_depth:.1f} / max {stats.max_depth} of {stats.buffers} buffers")
+    print(f"rasterizer stalled {stats.raster_stall_s:.2f}s on a full queue, "
+          f"encoder idle {stats.encoder_idle_s:.2f}s waiting for frames")
+
+
+if __name__ == "__main__":
+    main()
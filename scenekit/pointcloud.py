@@ -0,0 +1,108 @@
+import numpy as np
+from manim import Circle, VGroup, VMobject
+
+
+class GridIndex:
+    # Uniform grid over 2D points, stored CSR style: point ids sorted by cell
+    # plus one offset per cell. Radius queries touch only the cells that can
+    # hold a hit instead of measuring every point.
+    def __init__(self, points, cell_size):
+        self.points = np.asarray(points, dtype=float)[:, :2]
+        self.cell_size = cell_size
+        self.origin = self.points.min(axis=0)
+        self.cells = np.floor((self.points - self.origin) / cell_size).astype(np.int64)
+        self.shape = self.cells.max(axis=0) + 1
+        flat = self._flat(self.cells)
+        # Stable sort keeps ids ascending inside every cell
+        self.order = np.argsort(flat, kind="stable")
+        self.offsets = np.searchsorted(flat[self.order], np.arange(self.shape.prod() + 1))
+
+    def _flat(self, cells):
+        return cells[:, 0] * self.shape[1] + cells[:, 1]
+
+    def within(self, center, radius):
+        # Boolean mask of the points closer than radius to center
+        center = np.asarray(center, dtype=float)[:2]
+        lo = np.floor((center - radius - self.origin) / self.cell_size).astype(np.int64)
+        hi = np.floor((center + radius - self.origin) / self.cell_size).astype(np.int64)
+        lo = np.maximum(lo, 0)
+        hi = np.minimum(hi, self.shape - 1)
+        mask = np.zeros(len(self.points), dtype=bool)
+        if np.any(lo > hi):
+            return mask
+        # Cells of one grid column are contiguous, so each column is one slice
+        for cx in range(lo[0], hi[0] + 1):
+            start = self.offsets[cx * self.shape[1] + lo[1]]
+            stop = self.offsets[cx * self.shape[1] + hi[1] + 1]
+            ids = self.order[start:stop]
+            close = np.linalg.norm(self.points[ids] - center, axis=1) < radius
+            mask[ids[close]] = True
+        return mask
+
+    def _pairs(self, reach):
+        # (point, other point) for every point and every point in a cell at
+        # most reach cells away, its own cell included
+        counts = np.diff(self.offsets)
+        for dx in range(-reach, reach + 1):
+            for dy in range(-reach, reach + 1):
+                cells = self.cells + (dx, dy)
+                ids = np.flatnonzero(np.all((cells >= 0) & (cells < self.shape), axis=1))
+                flat = self._flat(cells[ids])
+                n = counts[flat]
+                rank = np.arange(n.sum()) - np.repeat(np.cumsum(n) - n, n)
+                yield np.repeat(ids, n), self.order[np.repeat(self.offsets[flat], n) + rank]
+
+    def thin(self, min_dist):
+        # Keep mask of the greedy pass in id order: a point is kept unless an
+        # earlier kept point is closer than min_dist. Dropped points block
+        # nothing. Needs cell_size <= min_dist / sqrt(2), so clashes are
+        # confined to a fixed block of neighbour cells.
+        if self.cell_size > min_dist / np.sqrt(2):
+            raise ValueError("thin() needs cell_size <= min_dist / sqrt(2).")
+        # Every clash as (later id, earlier id)
+        later, earlier = [], []
+        for src, dst in self._pairs(int(np.ceil(min_dist / self.cell_size))):
+            near = dst < src
+            near[near] = np.linalg.norm(self.points[src[near]] - self.points[dst[near]], axis=1) < min_dist
+            later.append(src[near])
+            earlier.append(dst[near])
+        later, earlier = np.concatenate(later), np.concatenate(earlier)
+
+        # Settle the greedy pass in rounds instead of one point at a time: a
+        # point is dropped as soon as an earlier clash is kept, and kept once
+        # every earlier clash is settled and dropped. The lowest unsettled id
+        # always settles, so this terminates; rounds track the longest chain.
+        keep = np.zeros(len(self.points), dtype=bool)
+        settled = np.zeros(len(self.points), dtype=bool)
+        while not settled.all():
+            settled[later[keep[earlier]]] = True
+            pending = ~settled[later]
+            later, earlier = later[pending], earlier[pending]
+            waiting = np.zeros(len(self.points), dtype=bool)
+            waiting[later[~settled[earlier]]] = True
+            ready = ~settled & ~waiting
+            keep |= ready
+            settled |= ready
+        return keep
+
+
+class DotCloud(VGroup):
+    # Thousands of equal dots as one filled VMobject per colour. Every dot is
+    # a copy of one circle outline written straight into the point array, so
+    # building, shifting and rendering cost a handful of array operations
+    # rather than one Dot mobject each.
+    def __init__(self, positions, palette, color_ids=None, radius=0.06, **kwargs):
+        super().__init__(**kwargs)
+        positions = np.asarray(positions, dtype=float)
+        if positions.shape[1] == 2:
+            positions = np.column_stack([positions, np.zeros(len(positions))])
+        if color_ids is None:
+            color_ids = np.zeros(len(positions), dtype=int)
+        outline = Circle(radius=radius).points
+
+        for index, color in enumerate(palette):
+            centers = positions[np.asarray(color_ids) == index]
+            layer = VMobject(fill_color=color, fill_opacity=1, stroke_width=0)
+            if len(centers):
+                layer.set_points((centers[:, None, :] + outline).reshape(-1, 3))
+            self.add(layer)
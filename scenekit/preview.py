@@ -0,0 +1,243 @@
+import argparse
+import ast
+import hashlib
+import inspect
+import json
+import shutil
+import textwrap
+import threading
+import time
+import traceback
+import webbrowser
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from multiprocessing import get_context
+from pathlib import Path
+
+from manim import config, tempconfig
+from manim.scene.scene_file_writer import SceneFileWriter
+
+from scenekit.loader import QUALITY, load_scene_class, local_sources_digest, render_config
+from scenekit.sections import SectionCache, context_fingerprint, render_settings
+
+PAGE = """<!doctype html>
+<title>scenekit preview</title>
+<body style="background:#111;color:#ddd;font:14px sans-serif;margin:0">
+<video id="video" controls autoplay muted style="width:100%;max-height:88vh"></video>
+<pre id="status" style="margin:8px;white-space:pre-wrap"></pre>
+<script>
+let version = -1;
+async function poll() {
+  try {
+    const status = await (await fetch("/status")).json();
+    document.getElementById("status").textContent = status.text;
+    if (status.movie && status.version !== version) {
+      version = status.version;
+      const video = document.getElementById("video");
+      const at = video.currentTime;
+      video.onloadedmetadata = () => { video.currentTime = Math.min(at, video.duration); };
+      video.src = "/movie?v=" + version;
+    }
+  } catch (e) {}
+  setTimeout(poll, 400);
+}
+poll();
+</script>
+"""
+
+
+def part_fingerprints(scene_cls):
+    # One AST dump per entry of PARTS, covering the methods it calls
+    fingerprints = []
+    for methods in scene_cls.PARTS:
+        dumps = []
+        for name in methods:
+            source = textwrap.dedent(inspect.getsource(getattr(scene_cls, name)))
+            dumps.append(ast.dump(ast.parse(source)))
+        fingerprints.append("\n".join(dumps))
+    return fingerprints
+
+
+def _render_sections(scene_cls, cache_dir):
+    scene = scene_cls()
+    cache = SectionCache(scene, cache_dir and Path(cache_dir) / "sections").install()
+    scene.render()
+    changed = [entry.name for entry in cache.plan if entry.key is not None and not entry.hit]
+    return scene.renderer.file_writer.movie_file_path, changed
+
+
+def _render_parts(scene_cls, file, cache_dir):
+    # Like scenekit.parallel, but every part movie is kept under a key of its
+    # methods' code, and only parts whose key is new are rendered
+    cache_dir = Path(cache_dir or Path(config.media_dir) / "part_cache")
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    methods = [name for part in scene_cls.PARTS for name in part]
+    base = hashlib.blake2b(digest_size=16)
+    base.update(render_settings().encode())
+    base.update(local_sources_digest(file).encode())
+    base.update(context_fingerprint(scene_cls, methods).encode())
+
+    movies, changed = [], []
+    for index, fingerprint in enumerate(part_fingerprints(scene_cls)):
+        key = hashlib.blake2b(base.digest() + fingerprint.encode(), digest_size=16).hexdigest()
+        movie = cache_dir / f"{key}.mp4"
+        if not movie.exists():
+            part_cls = type(f"{scene_cls.__name__}_Part{index}", (scene_cls,), {"parts": [index]})
+            scene = part_cls()
+            scene.render()
+            shutil.copyfile(scene.renderer.file_writer.movie_file_path, movie)
+            changed.append(" + ".join(scene_cls.PARTS[index]))
+        movies.append(str(movie))
+
+    writer = SceneFileWriter(None, scene_cls.__name__)
+    writer.combine_files(movies, writer.movie_file_path)
+    return writer.movie_file_path, changed
+
+
+def _render_once(file, scene_name, quality, cache_dir, conn):
+    # Runs in a forked child: the scene module is imported fresh on every
+    # render while manim itself stays imported in the parent
+    start = time.perf_counter()
+    try:
+        overrides = {"progress_bar": "none", "verbosity": "WARNING"}
+        with tempconfig(render_config(file, quality, **overrides)):
+            scene_cls = load_scene_class(file, scene_name)
+            if getattr(scene_cls, "PARTS", None):
+                movie, changed = _render_parts(scene_cls, file, cache_dir)
+            else:
+                movie, changed = _render_sections(scene_cls, cache_dir)
+        conn.send({"movie": str(movie), "changed": changed, "seconds": time.perf_counter() - start})
+    except BaseException:
+        conn.send({"error": traceback.format_exc(), "seconds": time.perf_counter() - start})
+    finally:
+        conn.close()
+
+
+class Preview:
+    # Watches a scene file and the helper modules beside it, re-renders on
+    # every save and serves the newest movie to a self-refreshing page.
+    # Section scenes go through SectionCache; scenes with PARTS re-render only
+    # the parts whose methods changed.
+    def __init__(self, file, scene_name, quality="l", cache_dir=None):
+        self.file = Path(file)
+        self.scene_name = scene_name
+        self.quality = quality
+        self.cache_dir = cache_dir
+        self.version = 0
+        self.movie = None
+        self.text = "rendering..."
+        self._lock = threading.Lock()
+
+    def _snapshot(self):
+        return {path: path.stat().st_mtime_ns for path in sorted(self.file.parent.glob("*.py"))}
+
+    def render(self):
+        ctx = get_context("fork")
+        receiver, sender = ctx.Pipe(duplex=False)
+        process = ctx.Process(
+            target=_render_once,
+            args=(self.file, self.scene_name, self.quality, self.cache_dir, sender),
+        )
+        process.start()
+        sender.close()
+        try:
+            result = receiver.recv()
+        except EOFError:
+            result = {"error": f"render process died with exit code {process.exitcode}", "seconds": 0.0}
+        process.join()
+
+        with self._lock:
+            if result.get("error"):
+                self.text = f"render failed after {result['seconds']:.1f}s, showing the last good movie\n\n{result['error']}"
+            else:
+                self.version += 1
+                self.movie = Path(result["movie"])
+                changed = ", ".join(result["changed"]) or "nothing (all cached)"
+                self.text = f"v{self.version}: re-rendered {changed} in {result['seconds']:.1f}s"
+        print(self.text.splitlines()[0], flush=True)
+
+    def status(self):
+        with self._lock:
+            return {"version": self.version, "movie": self.movie is not None, "text": self.text}
+
+    def watch(self, interval=0.3):
+        last = None
+        while True:
+            snapshot = self._snapshot()
+            if snapshot != last:
+                last = snapshot
+                self.render()
+            time.sleep(interval)
+
+    def handler(self):
+        preview = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+            def _send(self, code, body, content_type, headers=()):
+                self.send_response(code)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(body)))
+                self.send_header("Cache-Control", "no-store")
+                for name, value in headers:
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(body)
+
+            def do_GET(self):
+                path = self.path.split("?", 1)[0]
+                if path == "/":
+                    self._send(200, PAGE.encode(), "text/html")
+                elif path == "/status":
+                    self._send(200, json.dumps(preview.status()).encode(), "application/json")
+                elif path == "/movie" and preview.movie is not None:
+                    self._send_movie(preview.movie.read_bytes())
+                else:
+                    self._send(404, b"", "text/plain")
+
+            def _send_movie(self, data):
+                # Byte ranges, so the browser can seek in the video
+                spec = self.headers.get("Range", "")
+                if not spec.startswith("bytes="):
+                    self._send(200, data, "video/mp4", [("Accept-Ranges", "bytes")])
+                    return
+                first, _, last = spec[len("bytes="):].partition("-")
+                first = int(first or 0)
+                last = min(int(last), len(data) - 1) if last else len(data) - 1
+                self._send(206, data[first:last + 1], "video/mp4", [
+                    ("Accept-Ranges", "bytes"),
+                    ("Content-Range", f"bytes {first}-{last}/{len(data)}"),
+                ])
+
+        return Handler
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Live preview: re-render the edited sections / parts on every save and refresh the page."
+    )
+    parser.add_argument("file", help="scene file, e.g. visual-secrets/scenes/math_deep_dive.py")
+    parser.add_argument("scene", help="scene class, e.g. MathDeepDive")
+    parser.add_argument("-q", "--quality", choices=QUALITY, default="l")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--interval", type=float, default=0.3, help="seconds between file checks")
+    parser.add_argument("--cache-dir", help="defaults to folders under <media_dir>")
+    parser.add_argument("--no-browser", action="store_true")
+    args = parser.parse_args(argv)
+
+    preview = Preview(args.file, args.scene, args.quality, args.cache_dir)
+    server = ThreadingHTTPServer(("127.0.0.1", args.port), preview.handler())
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{args.port}/"
+    print(f"Preview at {url} (Ctrl+C to stop)")
+    if not args.no_browser:
+        webbrowser.open(url)
+    try:
+        preview.watch(args.interval)
+    except KeyboardInterrupt:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,138 @@
+import argparse
+import json
+import time
+from pathlib import Path
+
+from scenekit.loader import QUALITY, load_scene_class, render_config
+
+# Renderer internals timed inside every play(): (owner, method) -> phase
+PHASES = [
+    ("scene", "compile_animation_data", "setup"),
+    ("scene", "begin_animations", "setup"),
+    ("scene", "update_to_time", "interpolate"),
+    ("renderer", "update_frame", "rasterize"),
+    ("file_writer", "write_frame", "encode"),
+]
+
+
+def _now_us():
+    return time.perf_counter_ns() / 1000
+
+
+class AnimationProfiler:
+    # Opt-in instrumentation of Scene.play (Scene.wait goes through play).
+    # Each play becomes one Chrome trace span whose args hold the time spent in
+    # setup, interpolation, rasterization and encoding plus the number of
+    # mobjects and points it moved; every timed internal call is a child span.
+    # Scene code that runs between two plays (building mobjects, boolean ops)
+    # shows up as a "build" span.
+    def __init__(self, scene):
+        self.scene = scene
+        self.events = []
+        self._animation = None
+        self._last_end = None
+
+    def install(self):
+        owners = {
+            "scene": self.scene,
+            "renderer": self.scene.renderer,
+            "file_writer": self.scene.renderer.file_writer,
+        }
+        for owner, method, phase in PHASES:
+            self._wrap_phase(owners[owner], method, phase)
+
+        play = self.scene.play
+
+        def profiled_play(*args, **kwargs):
+            self._begin(args)
+            try:
+                return play(*args, **kwargs)
+            finally:
+                self._end()
+
+        self.scene.play = profiled_play
+        return self
+
+    def _wrap_phase(self, owner, method, phase):
+        original = getattr(owner, method)
+
+        def timed(*args, **kwargs):
+            start = _now_us()
+            try:
+                return original(*args, **kwargs)
+            finally:
+                self._phase(phase, method, start, _now_us())
+                if method == "begin_animations":
+                    self._count_touched()
+
+        setattr(owner, method, timed)
+
+    def _begin(self, animations):
+        start = _now_us()
+        if self._last_end is not None:
+            self._event("build", "build", self._last_end, start)
+        names = [type(getattr(anim, "animation", anim)).__name__ for anim in animations]
+        self._animation = {
+            "name": ", ".join(names) or "play",
+            "start": start,
+            "args": {"setup_ms": 0.0, "interpolate_ms": 0.0, "rasterize_ms": 0.0, "encode_ms": 0.0},
+        }
+
+    def _end(self):
+        end = _now_us()
+        animation, self._animation = self._animation, None
+        args = {key: round(value, 3) for key, value in animation["args"].items()}
+        self._event(animation["name"], "play", animation["start"], end, args)
+        self._last_end = end
+
+    def _phase(self, phase, method, start, end):
+        if self._animation is None:
+            return
+        self._animation["args"][f"{phase}_ms"] += (end - start) / 1000
+        self._event(method, phase, start, end)
+
+    def _count_touched(self):
+        if self._animation is None:
+            return
+        family = [sub for mob in self.scene.moving_mobjects for sub in mob.get_family()]
+        self._animation["args"]["mobjects"] = len(family)
+        self._animation["args"]["points"] = sum(len(sub.points) for sub in family)
+
+    def _event(self, name, category, start, end, args=None):
+        event = {"name": name, "cat": category, "ph": "X", "ts": start,
+                 "dur": end - start, "pid": 1, "tid": 1}
+        if args:
+            event["args"] = args
+        self.events.append(event)
+
+    def write(self, path):
+        trace = {"traceEvents": self.events, "displayTimeUnit": "ms"}
+        Path(path).write_text(json.dumps(trace))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Render a scene and write a per-animation Chrome trace (chrome://tracing, Perfetto)."
+    )
+    parser.add_argument("file")
+    parser.add_argument("scene")
+    parser.add_argument("-q", "--quality", choices=QUALITY, default="l")
+    parser.add_argument("-o", "--output", default="trace.json")
+    args = parser.parse_args(argv)
+
+    from manim import tempconfig
+
+    with tempconfig(render_config(args.file, args.quality, disable_caching=True)):
+        scene = load_scene_class(args.file, args.scene)()
+        profiler = AnimationProfiler(scene).install()
+        scene.render()
+    profiler.write(args.output)
+
+    plays = sorted((e for e in profiler.events if e["cat"] == "play"), key=lambda e: -e["dur"])
+    for event in plays[:10]:
+        print(f"{event['dur'] / 1e6:7.2f}s  {event['name']}")
+    print(f"Trace written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
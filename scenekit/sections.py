@@ -0,0 +1,189 @@
+import argparse
+import ast
+import hashlib
+import inspect
+import textwrap
+from collections import namedtuple
+from pathlib import Path
+
+import manim
+from manim import config, tempconfig
+from manim.scene.section import DefaultSectionType
+
+from scenekit.loader import (
+    QUALITY,
+    load_scene_class,
+    local_sources_digest,
+    mobject_digest,
+    render_config,
+)
+
+# One entry per next_section call: the file writer Section it opened, its
+# cache key (None when uncached) and whether the key was already cached
+PlannedSection = namedtuple("PlannedSection", ["name", "key", "hit", "section"])
+
+
+def section_fingerprints(scene_cls):
+    # construct() split at each top-level self.next_section(...) call:
+    # [preamble, section_1, section_2, ...]. Each entry is the AST dump of
+    # its statements, so comments and blank lines never invalidate a section.
+    source = textwrap.dedent(inspect.getsource(scene_cls.construct))
+    body = ast.parse(source).body[0].body
+    starts = [
+        i for i, stmt in enumerate(body)
+        if isinstance(stmt, ast.Expr)
+        and isinstance(stmt.value, ast.Call)
+        and isinstance(stmt.value.func, ast.Attribute)
+        and stmt.value.func.attr == "next_section"
+    ]
+    bounds = [0, *starts, len(body)]
+    return ["\n".join(ast.dump(stmt) for stmt in body[a:b]) for a, b in zip(bounds, bounds[1:])]
+
+
+def context_fingerprint(scene_cls, methods):
+    # AST dump of the scene's whole module with the given methods of
+    # scene_cls taken out: imports, helpers, class constants and every other
+    # method. Callers fingerprint the removed methods piece by piece, so an
+    # edit inside one of them leaves this fingerprint unchanged.
+    module = ast.parse(Path(inspect.getfile(scene_cls)).read_text())
+    owners = {}
+    for name in methods:
+        owners.setdefault(getattr(scene_cls, name).__qualname__.rsplit(".", 1)[0], set()).add(name)
+    for node in ast.walk(module):
+        if isinstance(node, ast.ClassDef) and node.name in owners:
+            node.body = [
+                stmt for stmt in node.body
+                if not (isinstance(stmt, ast.FunctionDef) and stmt.name in owners[node.name])
+            ]
+    return ast.dump(module)
+
+
+def render_settings():
+    # Everything besides the code that changes the rendered pixels
+    return repr((
+        manim.__version__,
+        config.pixel_width,
+        config.pixel_height,
+        config.frame_rate,
+        str(config.background_color),
+    ))
+
+
+class SectionCache:
+    # Reuses the rendered video of every section whose key is unchanged.
+    # A section's key covers its own code, the preamble of construct(), the
+    # rest of the scene file, the helper modules next to it, the render
+    # settings and a hash of what is on screen when the section starts, and
+    # it is chained onto the previous section's key. Mobjects and values
+    # built earlier and used later while off screen are only visible through
+    # the code that built them, so an edit to a section invalidates it and
+    # every section after it. Clean sections run with skip_animations (state
+    # is still applied, nothing is rasterized) and the final movie is
+    # stitched from cached and fresh section videos in order.
+    def __init__(self, scene, cache_dir=None):
+        self.scene = scene
+        self.cache_dir = Path(cache_dir or Path(config.media_dir) / "section_cache")
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.fingerprints = section_fingerprints(type(scene))
+        self.hits = 0
+        self.misses = 0
+        # Kept by section object rather than position: manim drops sections
+        # that end up without animations (its own "autocreated" first one
+        # included), so writer.sections and next_section calls don't line up.
+        self.plan = []
+
+        base = hashlib.blake2b(digest_size=16)
+        base.update(render_settings().encode())
+        base.update(local_sources_digest(inspect.getfile(type(scene))).encode())
+        base.update(context_fingerprint(type(scene), ["construct"]).encode())
+        base.update(self.fingerprints[0].encode())
+        self.base = base.digest()
+        # Key of the last keyed section, starting from the shared base
+        self._chain = self.base
+
+    def install(self):
+        next_section = self.scene.next_section
+
+        def cached_next_section(name="unnamed", section_type=DefaultSectionType.NORMAL, skip_animations=False):
+            # fingerprints[0] is the preamble before the first next_section
+            key = None if skip_animations else self._key(len(self.plan) + 1)
+            hit = key is not None and any(self.cache_dir.glob(f"{key}.*"))
+            if key is not None:
+                if hit:
+                    self.hits += 1
+                else:
+                    self.misses += 1
+            next_section(name, section_type, skip_animations or hit)
+            section = self.scene.renderer.file_writer.sections[-1]
+            self.plan.append(PlannedSection(name, key, hit, section))
+
+        self.scene.next_section = cached_next_section
+        self.scene.renderer.file_writer.combine_to_movie = self._assemble
+        return self
+
+    def _key(self, index):
+        # Sections created outside the top level of construct() are not cached
+        if index >= len(self.fingerprints):
+            return None
+        digest = hashlib.blake2b(self._chain, digest_size=16)
+        digest.update(self.fingerprints[index].encode())
+        digest.update(mobject_digest(self.scene.mobjects).encode())
+        self._chain = digest.digest()
+        return digest.hexdigest()
+
+    def _assemble(self):
+        # Replaces SceneFileWriter.combine_to_movie
+        writer = self.scene.renderer.file_writer
+        planned = {id(entry.section): entry for entry in self.plan}
+        movie_files = []
+        for section in writer.sections:
+            entry = planned.get(id(section))
+            key, hit = (entry.key, entry.hit) if entry else (None, False)
+            video = self.cache_dir / f"{key}.mp4"
+            if hit:
+                if video.exists():
+                    movie_files.append(str(video))
+                continue
+
+            files = section.get_clean_partial_movie_files()
+            if key is None:
+                movie_files.extend(files)
+            elif not files:
+                # Sections without animations still need a cache entry
+                (self.cache_dir / f"{key}.empty").touch()
+            else:
+                writer.combine_files(files, video)
+                movie_files.append(str(video))
+
+        # The same for the ones manim already dropped from writer.sections
+        kept = {id(section) for section in writer.sections}
+        for entry in self.plan:
+            if entry.key is not None and not entry.hit and id(entry.section) not in kept:
+                (self.cache_dir / f"{entry.key}.empty").touch()
+
+        if movie_files:
+            writer.combine_files(movie_files, writer.movie_file_path)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Render a scene, re-rendering only the next_section blocks that changed."
+    )
+    parser.add_argument("file", help="scene file, e.g. visual-secrets/scenes/visual_story.py")
+    parser.add_argument("scene", help="scene class, e.g. VisualThresholdStory")
+    parser.add_argument("-q", "--quality", choices=QUALITY, default="l")
+    parser.add_argument("--cache-dir", help="defaults to <media_dir>/section_cache")
+    args = parser.parse_args(argv)
+
+    with tempconfig(render_config(args.file, args.quality)):
+        scene_cls = load_scene_class(args.file, args.scene)
+        cache = SectionCache(scene_cls(), args.cache_dir).install()
+        cache.scene.render()
+        print(
+            f"{cache.hits} section(s) reused, {cache.misses} re-rendered: "
+            f"{cache.scene.renderer.file_writer.movie_file_path}"
+        )
+
+
+if __name__ == "__main__":
+    main()
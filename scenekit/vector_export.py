@@ -0,0 +1,169 @@
+import argparse
+import json
+import time
+import weakref
+import zlib
+from pathlib import Path
+
+import numpy as np
+from manim import VMobject, config, tempconfig
+from manim.utils.color import color_to_rgba
+
+from scenekit.loader import QUALITY, load_scene_class, render_config
+from scenekit.vector_player import DELTA, FRAME, MAGIC, OBJECT, PREAMBLE, UNCHANGED, VERSION
+
+# Point coordinates are stored in 1/1000 scene units, ~0.14 px at 1080p
+SCALE = 1000
+
+
+def _rgba_bytes(rgbas):
+    # First colour of a mobject's stroke or fill as 4 bytes; gradients keep
+    # only their first stop
+    rgba = rgbas[0] if len(rgbas) else np.zeros(4)
+    return bytes(np.clip(np.round(np.asarray(rgba) * 255), 0, 255).astype(np.uint8))
+
+
+class TimelineRecorder:
+    # Records a scene as a vector timeline instead of pixels. Every frame the
+    # renderer would emit becomes a snapshot of the point arrays and styles
+    # of all visible VMobjects, in draw order; rasterization is switched off
+    # entirely. Objects are tracked across frames by identity, so a frame
+    # only stores what moved, and only as a difference. The tracking holds
+    # weak references: a collected mobject's index is never handed to a new
+    # one (id() would be reused) and its delta base is dropped with it.
+    # Only VMobjects are captured (no images or OpenGL mobjects).
+    def __init__(self, scene, step=1):
+        self.scene = scene
+        self.step = step
+        self.frames = 0
+        self.keyframes = 0
+        self._indices = weakref.WeakKeyDictionary()
+        self._next_index = 0
+        self._previous = {}
+        self._chunks = []
+        self._compressor = zlib.compressobj(9)
+        # Size of the frame stream before compression
+        self.raw_bytes = 0
+
+    def install(self):
+        renderer = self.scene.renderer
+        renderer.update_frame = lambda *args, **kwargs: None
+        renderer.get_frame = lambda: None
+        renderer.add_frame = self._add_frame
+        return self
+
+    def _add_frame(self, frame, num_frames=1):
+        renderer = self.scene.renderer
+        if renderer.skip_animations:
+            return
+        now = renderer.time
+        renderer.time += num_frames / renderer.camera.frame_rate
+        index = self.frames
+        self.frames += num_frames
+        # Holds are always kept; of the animation frames every step-th one,
+        # the player interpolates across the gaps
+        if num_frames == 1 and index % self.step:
+            return
+        objects = self._snapshot()
+        hold = (num_frames - 1) / renderer.camera.frame_rate
+        self._write(FRAME.pack(now, hold, len(objects)) + b"".join(objects))
+        self.keyframes += 1
+
+    def _snapshot(self):
+        family = []
+        for root in self.scene.mobjects:
+            family.extend(root.get_family())
+        # Draw order as in manim's camera: a stable sort by z_index
+        family.sort(key=lambda mob: mob.z_index)
+
+        records = []
+        for mob in family:
+            if not isinstance(mob, VMobject) or len(mob.points) == 0:
+                continue
+            index = self._indices.get(mob)
+            if index is None:
+                index = self._indices[mob] = self._next_index
+                self._next_index += 1
+                weakref.finalize(mob, self._previous.pop, index, None)
+            points = np.round(mob.points[:, :2] * SCALE)
+            quantized = np.clip(points, -32768, 32767).astype(np.int16).view(np.uint16)
+            previous = self._previous.get(index)
+            if previous is not None and previous.shape == quantized.shape:
+                if np.array_equal(previous, quantized):
+                    flags, payload = UNCHANGED, b""
+                else:
+                    flags, payload = DELTA, (quantized - previous).astype("<u2").tobytes()
+            else:
+                flags, payload = 0, quantized.astype("<u2").tobytes()
+            self._previous[index] = quantized
+
+            header = OBJECT.pack(
+                index, len(quantized), flags,
+                _rgba_bytes(mob.get_stroke_rgbas()),
+                _rgba_bytes(mob.get_fill_rgbas()),
+                int(round(min(mob.get_stroke_width(), 655) * 100)),
+            )
+            records.append(header + payload)
+        return records
+
+    def _write(self, data):
+        self.raw_bytes += len(data)
+        self._chunks.append(self._compressor.compress(data))
+
+    def save(self, path):
+        self._chunks.append(self._compressor.flush())
+        header = json.dumps({
+            "frame_rate": config.frame_rate,
+            "frame_width": config.frame_width,
+            "frame_height": config.frame_height,
+            "pixel_width": config.pixel_width,
+            "pixel_height": config.pixel_height,
+            "background": [float(c) for c in color_to_rgba(config.background_color)],
+            "scale": SCALE,
+            "frames": self.frames,
+            "keyframes": self.keyframes,
+        }).encode()
+        with open(path, "wb") as f:
+            f.write(PREAMBLE.pack(MAGIC, VERSION, len(header)))
+            f.write(header)
+            for chunk in self._chunks:
+                f.write(chunk)
+        return Path(path).stat().st_size
+
+
+def export(file, scene_name, out_path, quality="l", step=1):
+    # Render scene_name from file as a vector timeline; returns the recorder
+    settings = render_config(
+        file, quality, write_to_movie=False, save_last_frame=False, disable_caching=True
+    )
+    with tempconfig(settings):
+        scene = load_scene_class(file, scene_name)()
+        recorder = TimelineRecorder(scene, step).install()
+        scene.render()
+        recorder.save(out_path)
+    return recorder
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Export a scene as a compact delta-encoded vector timeline instead of a video."
+    )
+    parser.add_argument("file", help="scene file, e.g. visual-secrets/scenes/visual_story.py")
+    parser.add_argument("scene", help="scene class, e.g. VisualThresholdStory")
+    parser.add_argument("-o", "--output", help="defaults to <scene>.skvx")
+    parser.add_argument("-q", "--quality", choices=QUALITY, default="l",
+                        help="sets frame rate and the player's default size")
+    parser.add_argument("--step", type=int, default=1,
+                        help="keep every n-th animation frame as a keyframe; the player interpolates between")
+    args = parser.parse_args(argv)
+
+    out = args.output or f"{args.scene}.skvx"
+    start = time.perf_counter()
+    recorder = export(args.file, args.scene, out, args.quality, args.step)
+    size = Path(out).stat().st_size
+    print(f"{recorder.frames} frames as {recorder.keyframes} keyframes in {time.perf_counter() - start:.2f}s")
+    print(f"{out}: {size / 1024:.1f} KiB ({recorder.raw_bytes / 1024:.0f} KiB of frame records before zlib)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,154 @@
+import argparse
+import json
+import struct
+import zlib
+
+import numpy as np
+
+# --- TIMELINE FORMAT ---
+# MAGIC, VERSION, header length, JSON header, then one zlib stream of frames.
+# Frame: time (f64), hold seconds (f32), object count (u32), then per object
+#   index (u32), point count (u32), flags (u8), stroke RGBA (4 x u8),
+#   fill RGBA (4 x u8), stroke width * 100 (u16)
+# followed by the points unless UNCHANGED is set: x, y as 16-bit integers in
+# units of 1 / header["scale"], absolute or (with DELTA) the wrapping
+# difference to the same object's points in the frame it last appeared in.
+# Unmoved objects cost 18 bytes a frame before compression, moved ones mostly
+# small deltas, which zlib folds away.
+MAGIC = b"SKVX"
+VERSION = 1
+PREAMBLE = struct.Struct("<4sBI")
+FRAME = struct.Struct("<dfI")
+OBJECT = struct.Struct("<IIB4s4sH")
+DELTA = 1
+UNCHANGED = 2
+
+
+def read_timeline(path):
+    # (header, frames); each frame is (time, hold, objects) and each object
+    # (index, points (n, 2) float, stroke RGBA, fill RGBA, stroke width)
+    with open(path, "rb") as f:
+        data = f.read()
+    magic, version, header_size = PREAMBLE.unpack_from(data)
+    if magic != MAGIC or version != VERSION:
+        raise ValueError("Not a scenekit vector timeline.")
+    header = json.loads(data[PREAMBLE.size:PREAMBLE.size + header_size])
+    body = zlib.decompress(data[PREAMBLE.size + header_size:])
+    scale = header["scale"]
+
+    previous = {}
+    frames = []
+    offset = 0
+    while offset < len(body):
+        time, hold, count = FRAME.unpack_from(body, offset)
+        offset += FRAME.size
+        objects = []
+        for _ in range(count):
+            index, n, flags, stroke, fill, width = OBJECT.unpack_from(body, offset)
+            offset += OBJECT.size
+            if flags & UNCHANGED:
+                quantized = previous[index]
+            else:
+                raw = np.frombuffer(body, dtype="<u2", count=2 * n, offset=offset).reshape(n, 2)
+                offset += raw.nbytes
+                quantized = previous[index] + raw if flags & DELTA else raw.copy()
+            previous[index] = quantized
+            points = quantized.view(np.int16).astype(float) / scale
+            objects.append((index, points, np.frombuffer(stroke, np.uint8), np.frombuffer(fill, np.uint8), width / 100))
+        frames.append((time, hold, objects))
+    return header, frames
+
+
+def _mix(a, b, alpha):
+    if isinstance(a, np.ndarray) and a.dtype == np.uint8:
+        return ((1 - alpha) * a + alpha * b).round().astype(np.uint8)
+    return (1 - alpha) * a + alpha * b
+
+
+class TimelinePlayer:
+    # Reference player: the scene at any time t, interpolating point arrays
+    # linearly between recorded frames, and a cairo rasterizer for it.
+    def __init__(self, path):
+        self.header, self.frames = read_timeline(path)
+        self.times = np.array([time for time, _, _ in self.frames])
+        last_time, last_hold, _ = self.frames[-1] if self.frames else (0.0, 0.0, None)
+        self.duration = last_time + last_hold + 1 / self.header["frame_rate"]
+
+    def objects_at(self, t):
+        if not self.frames:
+            return []
+        i = max(int(np.searchsorted(self.times, t, side="right")) - 1, 0)
+        time, hold, objects = self.frames[i]
+        if i + 1 == len(self.frames) or t <= time + hold:
+            return objects
+        next_time, _, next_objects = self.frames[i + 1]
+        alpha = (t - time - hold) / (next_time - time - hold)
+        before = {obj[0]: obj for obj in objects}
+        after = {obj[0]: obj for obj in next_objects}
+        blended = []
+        # Draw order and membership switch over halfway between the frames
+        for obj in objects if alpha < 0.5 else next_objects:
+            a, b = before.get(obj[0]), after.get(obj[0])
+            if a is None or b is None or a[1].shape != b[1].shape:
+                blended.append(obj)
+            else:
+                blended.append((obj[0], *(_mix(x, y, alpha) for x, y in zip(a[1:], b[1:]))))
+        return blended
+
+    def _draw(self, t, width, height):
+        import cairo
+
+        header = self.header
+        surface = cairo.ImageSurface(cairo.FORMAT_ARGB32, width, height)
+        ctx = cairo.Context(surface)
+        ctx.set_source_rgba(*header["background"])
+        ctx.paint()
+        # Scene units, y up, origin in the middle of the frame
+        ctx.scale(width / header["frame_width"], -height / header["frame_height"])
+        ctx.translate(header["frame_width"] / 2, -header["frame_height"] / 2)
+
+        for _, points, stroke, fill, stroke_width in self.objects_at(t):
+            ctx.new_path()
+            for start, h1, h2, end in points[: len(points) // 4 * 4].reshape(-1, 4, 2):
+                if not ctx.has_current_point() or not np.allclose(ctx.get_current_point(), start):
+                    ctx.move_to(*start)
+                ctx.curve_to(*h1, *h2, *end)
+            if fill[3]:
+                ctx.set_source_rgba(*(fill / 255))
+                ctx.fill_preserve()
+            if stroke[3] and stroke_width:
+                ctx.set_source_rgba(*(stroke / 255))
+                # Same scaling as manim's cairo camera
+                ctx.set_line_width(stroke_width * 0.01)
+                ctx.stroke_preserve()
+        surface.flush()
+        return surface
+
+    def render(self, t, width=None, height=None):
+        # (height, width, 4) uint8 RGBA frame at time t
+        width = width or self.header["pixel_width"]
+        height = height or self.header["pixel_height"]
+        surface = self._draw(t, width, height)
+        bgra = np.ndarray((height, surface.get_stride() // 4, 4), np.uint8, surface.get_data())[:, :width]
+        return bgra[..., [2, 1, 0, 3]].copy()
+
+    def save_png(self, t, path):
+        self._draw(t, self.header["pixel_width"], self.header["pixel_height"]).write_to_png(path)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Inspect a vector timeline or render single frames from it.")
+    parser.add_argument("timeline", help=".skvx file written by scenekit.vector_export")
+    parser.add_argument("--png", nargs=2, action="append", metavar=("TIME", "FILE"),
+                        help="render the frame at TIME seconds to FILE (repeatable)")
+    args = parser.parse_args(argv)
+
+    player = TimelinePlayer(args.timeline)
+    count = sum(len(objects) for _, _, objects in player.frames)
+    print(f"{len(player.frames)} keyframes, {count} object states, {player.duration:.2f}s")
+    for time, file in args.png or []:
+        player.save_png(float(time), file)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+import textwrap
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("manim")
+from manim import tempconfig
+
+from scenekit.loader import load_scene_class, render_config
+from scenekit.sections import SectionCache
+
+# next_section before the first play (manim drops its autocreated section)
+# and a section without animations (dropped as well) shift any pairing of
+# writer.sections with next_section calls by position
+SCENE = """
+from manim import *
+
+class Sectioned(Scene):
+    def construct(self):
+        self.next_section("Intro")
+        dot = Dot()
+        self.play(FadeIn(dot), run_time=0.2)
+
+        self.next_section("Setup only")
+        square = Square().shift(RIGHT)
+        self.add(square)
+
+        self.next_section("Move")
+        self.play(dot.animate.shift(LEFT), run_time=0.2)
+
+        self.next_section("Outro")
+        self.play(FadeOut(dot, square), run_time=0.2)
+"""
+
+
+def _render(file, media_dir, cache_dir):
+    settings = render_config(file, "l", media_dir=str(media_dir), disable_caching=True, progress_bar="none")
+    with tempconfig(settings):
+        scene = load_scene_class(file, "Sectioned")()
+        cache = SectionCache(scene, cache_dir).install()
+        writer = scene.renderer.file_writer
+        combined = []
+        combine_files = writer.combine_files
+
+        def recording_combine_files(input_files, output_file, *args, **kwargs):
+            if Path(output_file) == Path(writer.movie_file_path):
+                combined[:] = [Path(f).name for f in input_files]
+            return combine_files(input_files, output_file, *args, **kwargs)
+
+        writer.combine_files = recording_combine_files
+        scene.render()
+    return cache, combined
+
+
+def test_rerender_reuses_every_section(tmp_path):
+    file = tmp_path / "sectioned.py"
+    file.write_text(textwrap.dedent(SCENE))
+    cache_dir = tmp_path / "cache"
+
+    first, first_movie = _render(file, tmp_path / "media1", cache_dir)
+    assert (first.hits, first.misses) == (0, 4)
+
+    second, second_movie = _render(file, tmp_path / "media2", cache_dir)
+    assert (second.hits, second.misses) == (4, 0)
+    assert [entry.key for entry in second.plan] == [entry.key for entry in first.plan]
+
+    # Every animated section, in order, from the cache
+    animated = [f"{entry.key}.mp4" for entry in second.plan if entry.name != "Setup only"]
+    assert first_movie == animated
+    assert second_movie == animated
+    assert all((cache_dir / name).exists() for name in animated)
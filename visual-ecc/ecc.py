@@ -0,0 +1,157 @@
+import numpy as np
+
+
+class Curve:
+    # Short Weierstrass curve y^2 = x^3 + a*x + b over F_p.
+    # p must stay below 2^31 so every product of two reduced field elements
+    # fits in int64; that keeps all point arithmetic in vectorized NumPy.
+    # Points are (X, Y, Z) Jacobian arrays, the affine point being
+    # (X / Z^2, Y / Z^3); Z = 0 is the point at infinity.
+    WINDOW = 4
+
+    def __init__(self, p, a, b):
+        if p >= 2**31:
+            raise ValueError("p must be below 2^31 for int64 arithmetic.")
+        if (4 * a**3 + 27 * b**2) % p == 0:
+            raise ValueError("Singular curve: 4a^3 + 27b^2 = 0 mod p.")
+        self.p, self.a, self.b = p, a % p, b % p
+
+    # --- FIELD HELPERS ---
+    def _pow(self, base, exponent):
+        # Square-and-multiply with a scalar exponent over a whole array
+        result = np.ones_like(base)
+        base = base % self.p
+        while exponent:
+            if exponent & 1:
+                result = result * base % self.p
+            base = base * base % self.p
+            exponent >>= 1
+        return result
+
+    def inverse(self, values):
+        return self._pow(np.asarray(values, dtype=np.int64), self.p - 2)
+
+    # --- POINT SETS ---
+    def affine_points(self):
+        # Every finite point of the curve, found by looking each right-hand
+        # side up in a table of square roots. Returns (xs, ys).
+        p = self.p
+        x = np.arange(p, dtype=np.int64)
+        rhs = (x * x % p * x + self.a * x + self.b) % p
+        half = np.arange((p + 1) // 2, dtype=np.int64)
+        root = np.full(p, -1, dtype=np.int64)
+        root[half * half % p] = half
+        y = root[rhs]
+        on_curve = y >= 0
+        x, y = x[on_curve], y[on_curve]
+        # Each non-zero root has a partner p - y
+        pair = y != 0
+        return np.concatenate([x, x[pair]]), np.concatenate([y, (p - y[pair]) % p])
+
+    def order(self):
+        # Number of points including infinity
+        return len(self.affine_points()[0]) + 1
+
+    def jacobian(self, xs, ys):
+        xs = np.asarray(xs, dtype=np.int64) % self.p
+        return xs, np.asarray(ys, dtype=np.int64) % self.p, np.ones_like(xs)
+
+    def to_affine(self, point):
+        # (xs, ys, finite mask); one batched inversion for all points
+        X, Y, Z = point
+        finite = Z != 0
+        z_inv = self.inverse(np.where(finite, Z, 1))
+        z_inv2 = z_inv * z_inv % self.p
+        xs = X * z_inv2 % self.p
+        ys = Y * (z_inv2 * z_inv % self.p) % self.p
+        return xs, ys, finite
+
+    # --- GROUP LAW (Jacobian, vectorized) ---
+    def double(self, point):
+        p = self.p
+        X, Y, Z = point
+        YY = Y * Y % p
+        S = 4 * X % p * YY % p
+        ZZ = Z * Z % p
+        M = (3 * (X * X % p) + self.a * (ZZ * ZZ % p)) % p
+        X3 = (M * M - 2 * S) % p
+        Y3 = (M * ((S - X3) % p) - 8 * (YY * YY % p)) % p
+        Z3 = 2 * Y % p * Z % p
+        return X3, Y3, Z3
+
+    def add(self, P, Q):
+        p = self.p
+        X1, Y1, Z1 = P
+        X2, Y2, Z2 = Q
+        Z1Z1 = Z1 * Z1 % p
+        Z2Z2 = Z2 * Z2 % p
+        U1 = X1 * Z2Z2 % p
+        U2 = X2 * Z1Z1 % p
+        S1 = Y1 * (Z2 * Z2Z2 % p) % p
+        S2 = Y2 * (Z1 * Z1Z1 % p) % p
+        H = (U2 - U1) % p
+        R = (S2 - S1) % p
+        HH = H * H % p
+        HHH = H * HH % p
+        V = U1 * HH % p
+        X3 = (R * R - HHH - 2 * V) % p
+        Y3 = (R * ((V - X3) % p) - S1 * HHH) % p
+        Z3 = H * (Z1 * Z2 % p) % p
+
+        # Special cases, resolved lane by lane: P = Q needs the doubling
+        # formula, P = -Q gives infinity (Z3 = 0 already), and an infinite
+        # input returns the other one.
+        same = (H == 0) & (R == 0) & (Z1 != 0) & (Z2 != 0)
+        if same.any():
+            D = self.double(P)
+            X3, Y3, Z3 = (np.where(same, d, c) for d, c in zip(D, (X3, Y3, Z3)))
+        X3, Y3, Z3 = (np.where(Z1 == 0, q, c) for q, c in zip(Q, (X3, Y3, Z3)))
+        X3, Y3, Z3 = (np.where(Z2 == 0, q, c) for q, c in zip(P, (X3, Y3, Z3)))
+        return X3, Y3, Z3
+
+    def negate(self, point):
+        X, Y, Z = point
+        return X, (-Y) % self.p, Z
+
+    # --- SCALAR MULTIPLICATION ---
+    def multiply(self, scalar, point):
+        # scalar * point for every lane, fixed window of WINDOW bits.
+        # A 256-bit scalar costs 256 doublings and 64 additions, each a
+        # handful of array operations however many points are in the batch.
+        w = self.WINDOW
+        infinity = (np.zeros_like(point[0]), np.ones_like(point[1]), np.zeros_like(point[2]))
+        table = [infinity, point]
+        for _ in range(2, 2**w):
+            table.append(self.add(table[-1], point))
+
+        digits = []
+        while scalar:
+            digits.append(scalar & (2**w - 1))
+            scalar >>= w
+        result = infinity
+        for digit in reversed(digits):
+            for _ in range(w):
+                result = self.double(result)
+            if digit:
+                result = self.add(result, table[digit])
+        return result
+
+    def ladder_walk(self, scalar, x, y):
+        # Affine points visited by left-to-right double-and-add on one point,
+        # one entry per step as (operation, x, y, finite) for animation.
+        base = self.jacobian([x], [y])
+        current = (np.zeros(1, np.int64), np.ones(1, np.int64), np.zeros(1, np.int64))
+        steps = []
+        for bit in bin(scalar)[2:]:
+            current = self.double(current)
+            steps.append(("double", current))
+            if bit == "1":
+                current = self.add(current, base)
+                steps.append(("add", current))
+        # One batched inversion converts every step back to affine
+        X, Y, Z = (np.concatenate(coords) for coords in zip(*(point for _, point in steps)))
+        xs, ys, finite = self.to_affine((X, Y, Z))
+        return [
+            (operation, int(x), int(y), bool(f))
+            for (operation, _), x, y, f in zip(steps, xs, ys, finite)
+        ]
@@ -0,0 +1,102 @@
+from manim import *
+import numpy as np
+import random
+
+from scenekit.pointcloud import DotCloud
+
+from ecc import Curve
+
+class EllipticCurveCloud(Scene):
+    # Every point of a small curve over F_p drawn as one batched mobject,
+    # then the double-and-add walk behind a 256-bit scalar multiplication.
+    P = 4093
+    A = 2
+    B = 3
+    SCALAR_BITS = 256
+    SEED = 42
+    # Walk steps animated one by one before the rest is traced in one go
+    SHOWN_STEPS = 16
+
+    def construct(self):
+        # --- CONFIGURATION ---
+        curve = Curve(self.P, self.A, self.B)
+        xs, ys = curve.affine_points()
+        rng = random.Random(self.SEED)
+        scalar = rng.getrandbits(self.SCALAR_BITS) | 1 << (self.SCALAR_BITS - 1)
+        base = rng.randrange(len(xs))
+
+        side = 5.6
+        center = DOWN * 0.6
+
+        def to_scene(x, y):
+            x = np.asarray(x, dtype=float) / (self.P - 1) - 0.5
+            y = np.asarray(y, dtype=float) / (self.P - 1) - 0.5
+            return np.column_stack([x * side, y * side, np.zeros(len(x))]) + center
+
+        # --- SCENE 1: THE CLOUD ---
+        self.next_section("The Cloud")
+
+        title = Text(f"y² = x³ + {self.A}x + {self.B}  over  F_{self.P}", font_size=32)
+        count = Text(f"{len(xs) + 1} points, counting the point at infinity", font_size=20, color=GRAY)
+        VGroup(title, count).arrange(DOWN, buff=0.15).to_edge(UP)
+
+        border = Square(side_length=side + 0.2, color=GREY, stroke_width=1).move_to(center)
+        cloud = DotCloud(to_scene(xs, ys), [BLUE_C], radius=0.012)
+
+        self.play(Write(title), Create(border))
+        self.play(FadeIn(cloud), FadeIn(count))
+        self.wait(1)
+
+        # --- SCENE 2: THE WALK ---
+        self.next_section("The Walk")
+
+        walk = [step for step in curve.ladder_walk(scalar, int(xs[base]), int(ys[base])) if step[3]]
+        path = to_scene([step[1] for step in walk], [step[2] for step in walk])
+        doublings = sum(step[0] == "double" for step in walk)
+
+        start = to_scene([xs[base]], [ys[base]])[0]
+        g_dot = Dot(start, color=YELLOW, radius=0.08).set_z_index(10)
+        g_lbl = Text("G", font_size=24, color=YELLOW).next_to(g_dot, UR, buff=0.05)
+        task = Text(f"Q = k·G for a {self.SCALAR_BITS}-bit k", font_size=24).to_corner(DL)
+        self.play(FadeIn(g_dot), Write(g_lbl), Write(task))
+
+        walker = Dot(start, color=ORANGE, radius=0.06).set_z_index(10)
+        self.add(walker)
+        hops = VGroup()
+        previous = start
+        for (operation, *_), point in zip(walk[:self.SHOWN_STEPS], path):
+            color = ORANGE if operation == "double" else GREEN
+            hop = Line(previous, point, color=color, stroke_width=2, stroke_opacity=0.6)
+            hops.add(hop)
+            self.play(Create(hop), walker.animate.move_to(point).set_color(color), run_time=0.25)
+            previous = point
+
+        # The remaining hops as one polyline
+        rest = VMobject(stroke_color=GREY_B, stroke_width=1, stroke_opacity=0.4)
+        rest.set_points_as_corners(path[self.SHOWN_STEPS - 1:])
+        self.play(Create(rest), MoveAlongPath(walker, rest), run_time=3)
+
+        q_dot = Dot(path[-1], color=RED, radius=0.08).set_z_index(11)
+        q_lbl = Text("Q", font_size=24, color=RED).next_to(q_dot, UR, buff=0.05)
+        tally = Text(
+            f"{doublings} doublings + {len(walk) - doublings} additions",
+            font_size=20, color=GRAY
+        ).next_to(task, UP, aligned_edge=LEFT)
+        self.play(FadeIn(q_dot), Write(q_lbl), Write(tally))
+        self.wait(2)
+
+        # --- SCENE 3: EVERY POINT AT ONCE ---
+        self.next_section("Every Point At Once")
+
+        # One batched multiplication sends every point P to k·P
+        image_x, image_y, finite = curve.to_affine(curve.multiply(scalar, curve.jacobian(xs, ys)))
+        movers = DotCloud(to_scene(xs[finite], ys[finite]), [BLUE_C], radius=0.012)
+        images = DotCloud(to_scene(image_x[finite], image_y[finite]), [TEAL_C], radius=0.012)
+        batch_text = Text("k·P for every point, in one vectorized pass", font_size=24).to_corner(DL)
+
+        self.remove(cloud)
+        self.add(movers)
+        self.play(FadeOut(VGroup(g_dot, g_lbl, walker, hops, rest, q_dot, q_lbl, task, tally)))
+        self.play(Write(batch_text))
+        self.play(Transform(movers, images), run_time=3)
+        self.wait(2)
@@ -0,0 +1,83 @@
+from manim import *
+
+from scenekit.glyphs import GlyphSet
+
+
+class ColorblindRound:
+    # One round of the colorblind protocol, built once and replayed for
+    # every round. Labels that never change are shaped here; the round number
+    # and confidence interval are composed from pre-shaped glyphs, so a
+    # replay only swaps parameters (switch or stay, round number, certainty)
+    # and the cost of a round no longer grows with the text it shows.
+    def __init__(self, ball_left, ball_right, cert_num, pivot):
+        self.ball_left, self.ball_right = ball_left, ball_right
+        self.cert_num = cert_num
+        self.pivot = pivot
+
+        self.round_word = Text("Round", font_size=24, color=YELLOW)
+        self.digits = GlyphSet("0123456789", font_size=24, color=YELLOW)
+        self.ci_glyphs = GlyphSet("(95% CI 0123456789.-)", font_size=16, color=GRAY)
+        self.blindfold = Text("[Peggy Looks Away]", font_size=20, color=RED).to_corner(UR)
+        self.secret = {
+            switch: Text(
+                f"[Victor secretly chooses: {'SWITCHING' if switch else 'NOT SWITCHING'}]",
+                font_size=24, color=GRAY_B
+            ).to_edge(DOWN).shift(UP * 1.5)
+            for switch in (True, False)
+        }
+        self.reply = {
+            True: Text("Peggy: 'Switched!'", color=PINK, font_size=24),
+            False: Text("Peggy: 'Stayed!'", color=PINK, font_size=24),
+        }
+        self.ci_lbl = None
+
+    def round_label(self, number):
+        return VGroup(self.round_word.copy(), self.digits.compose(str(number))).arrange(
+            RIGHT, buff=self.digits.space, aligned_edge=DOWN
+        ).to_corner(UL)
+
+    def replay(self, scene, number, switch, certainty, ci_low, ci_high, pace=1.0):
+        # Plays one round on scene; pace scales every run time and hold
+        balls = VGroup(self.ball_left, self.ball_right)
+        round_lbl = self.round_label(number)
+        scene.play(FadeIn(round_lbl), run_time=pace)
+
+        scene.play(
+            self.ball_left.animate.set_color(GRAY),
+            self.ball_right.animate.set_color(GRAY),
+            run_time=0.3 * pace
+        )
+        scene.play(FadeIn(self.blindfold), run_time=pace)
+        scene.play(FadeIn(self.secret[switch]), run_time=pace)
+
+        scene.play(Rotate(balls, angle=PI, about_point=self.pivot), run_time=0.5 * pace)
+        if switch:
+            scene.play(Swap(self.ball_left, self.ball_right), run_time=0.3 * pace)
+        else:
+            scene.wait(0.3 * pace)
+        scene.play(Rotate(balls, angle=PI, about_point=self.pivot), run_time=0.5 * pace)
+
+        scene.play(FadeOut(self.secret[switch]), FadeOut(self.blindfold), run_time=pace)
+
+        reply = self.reply[switch].next_to(self.ball_left, UP, buff=0.8)
+        scene.play(
+            self.ball_left.animate.set_color(GREEN if switch else RED),
+            self.ball_right.animate.set_color(RED if switch else GREEN),
+            Write(reply),
+            run_time=pace
+        )
+
+        new_ci = self.ci_glyphs.compose(f"(95% CI {ci_low:.2f}-{ci_high:.2f}%)").next_to(self.cert_num, RIGHT)
+        scene.play(
+            self.cert_num.animate.set_value(certainty),
+            ReplacementTransform(self.ci_lbl, new_ci) if self.ci_lbl else FadeIn(new_ci),
+            run_time=0.5 * pace
+        )
+        self.ci_lbl = new_ci
+        scene.wait(pace)
+
+        if switch:
+            self.ball_left.set_color(RED)
+            self.ball_right.set_color(GREEN)
+
+        scene.play(FadeOut(round_lbl), FadeOut(reply), run_time=pace)
@@ -1,26 +1,69 @@
 from manim import *
 import numpy as np
-import random
+
+from scenekit.geometry_cache import geometry_cache
+from scenekit.pointcloud import DotCloud, GridIndex
+
+from round_template import ColorblindRound
+from soundness import simulate
 
 class ZKP_Final_Narrative_V9(Scene):
-    def construct(self):
+    # Each part ends in self.clear() and shares no state with the others,
+    # so scenekit.parallel can render them in separate processes.
+    PARTS = [
         # 0. DEFINITION
-        self.intro_definition()
-
+        ["intro_definition"],
         # 1. INTUITION (Colorblind)
-        self.intro_sequence_1()
-        self.scene_colorblind_loop()
-        
+        ["intro_sequence_1", "scene_colorblind_loop"],
         # 2. INTERLUDE (Where's Waldo)
-        self.intro_sequence_waldo()
-        self.scene_wheres_waldo()
-        
+        ["intro_sequence_waldo", "scene_wheres_waldo"],
         # 3. THE ANALOGY (Ali Baba)
-        self.intro_sequence_alibaba()
-        self.scene_alibaba_final()
-        
+        ["intro_sequence_alibaba", "scene_alibaba_final"],
         # 4. OUTRO
-        self.outro_contact_slide()
+        ["outro_contact_slide"],
+    ]
+    # Indices into PARTS to render, None for the full narrative
+    parts = None
+
+    # Where's Waldo map: fixed seed so every render draws the same map
+    WALDO_SEED = 42
+    WALDO_DISTRACTORS = 80
+    WALDO_DOT_RADIUS = 0.06
+
+    # Monte Carlo runs behind the certainty counter and the cave statistics
+    SIM_TRIALS = 1_000_000
+    SIM_ROUNDS = 10
+    SIM_SEED = 42
+    # Colorblind rounds played at full pace before the rest replay faster
+    DETAILED_ROUNDS = 3
+    REPLAY_PACE = 0.3
+
+    def construct(self):
+        indices = range(len(self.PARTS)) if self.parts is None else self.parts
+        for index in indices:
+            for method in self.PARTS[index]:
+                getattr(self, method)()
+
+    # --- CACHED GEOMETRY ---
+    # Built once, then loaded from scenekit's on-disk geometry cache
+    @staticmethod
+    def build_shield(center, hole_size):
+        center = np.array(center)
+        # HUGE rectangles
+        r_top = Rectangle(width=25, height=12, color=BLACK, fill_opacity=1).move_to(center + UP * (6 + hole_size))
+        r_bot = Rectangle(width=25, height=12, color=BLACK, fill_opacity=1).move_to(center + DOWN * (6 + hole_size))
+        r_left = Rectangle(width=12, height=25, color=BLACK, fill_opacity=1).move_to(center + LEFT * (6 + hole_size))
+        r_right = Rectangle(width=12, height=25, color=BLACK, fill_opacity=1).move_to(center + RIGHT * (6 + hole_size))
+        
+        hole_ring = Circle(radius=hole_size, color=WHITE).move_to(center)
+        return VGroup(r_top, r_bot, r_left, r_right, hole_ring)
+
+    @staticmethod
+    def build_cave(center):
+        center = np.array(center)
+        cave = Annulus(inner_radius=1.5, outer_radius=2.5, color=GRAY).rotate(PI).move_to(center)
+        mask = Rectangle(width=2, height=2, color=BLACK, fill_opacity=1).move_to(center + DOWN * 2)
+        return Difference(cave, mask, color=GRAY, fill_opacity=0.5)
 
     # --- PART 0: WHAT IS A ZKP? ---
     def intro_definition(self):
@@ -85,58 +128,26 @@ class ZKP_Final_Narrative_V9(Scene):
         ball_right = Dot(radius=0.6, color=GREEN).move_to(RIGHT * 1.5 + DOWN * 0.2)
         self.play(FadeIn(ball_left, ball_right))
 
-        certainties = [50.0, 75.0, 87.5]
-        
-        for i in range(3):
-            n = i + 1
-            round_lbl = Text(f"Round {n}", font_size=24, color=YELLOW).to_corner(UL)
-            self.play(FadeIn(round_lbl))
-            
-            self.play(
-                ball_left.animate.set_color(GRAY),
-                ball_right.animate.set_color(GRAY),
-                run_time=0.3
-            )
-            
-            blindfold = Text("[Peggy Looks Away]", font_size=20, color=RED).to_corner(UR)
-            self.play(FadeIn(blindfold))
-            
-            do_switch = (i % 2 == 0) 
-            decision_text = "SWITCHING" if do_switch else "NOT SWITCHING"
-            secret_lbl = Text(f"[Victor secretly chooses: {decision_text}]", font_size=24, color=GRAY_B).to_edge(DOWN).shift(UP * 1.5)
-            self.play(FadeIn(secret_lbl))
+        # Empirical certainty after each round: the share of simulated
+        # cheating provers caught so far, with its 95% confidence interval
+        soundness = simulate("colorblind", rounds=self.SIM_ROUNDS, trials=self.SIM_TRIALS, seed=self.SIM_SEED)
+        certainties = 100 * (1 - soundness.cheat_survival)
 
-            self.play(Rotate(VGroup(ball_left, ball_right), angle=PI, about_point=DOWN*0.2), run_time=0.5)
-            if do_switch:
-                self.play(Swap(ball_left, ball_right), run_time=0.3)
-            else:
-                self.wait(0.3)
-            self.play(Rotate(VGroup(ball_left, ball_right), angle=PI, about_point=DOWN*0.2), run_time=0.5)
-            
-            self.play(FadeOut(secret_lbl), FadeOut(blindfold))
-            
-            left_col = GREEN if do_switch else RED
-            right_col = RED if do_switch else GREEN
-            
-            peggy_msg = "Peggy: 'Switched!'" if do_switch else "Peggy: 'Stayed!'"
-            msg_obj = Text(peggy_msg, color=PINK, font_size=24).next_to(ball_left, UP, buff=0.8)
-            
-            self.play(
-                ball_left.animate.set_color(left_col),
-                ball_right.animate.set_color(right_col),
-                Write(msg_obj)
+        # Every round replays one prebuilt template with new parameters.
+        # The first rounds play at full pace, the rest of SIM_ROUNDS faster.
+        template = ColorblindRound(ball_left, ball_right, cert_num, DOWN * 0.2)
+        for i in range(self.SIM_ROUNDS):
+            template.replay(
+                self, i + 1, i % 2 == 0, certainties[i],
+                100 * (1 - soundness.ci_high[i]), 100 * (1 - soundness.ci_low[i]),
+                pace=1.0 if i < self.DETAILED_ROUNDS else self.REPLAY_PACE
             )
-            
-            self.play(cert_num.animate.set_value(certainties[i]), run_time=0.5)
-            self.wait(1)
-            
-            if do_switch:
-                 ball_left.set_color(RED)
-                 ball_right.set_color(GREEN)
-            
-            self.play(FadeOut(round_lbl), FadeOut(msg_obj))
 
-        final_stat = Text("Repeat 10 times -> Chance of luck is < 0.1%", font_size=24, color=YELLOW).to_edge(DOWN)
+        luck = 100 * soundness.cheat_survival[-1]
+        final_stat = Text(
+            f"Repeat {self.SIM_ROUNDS} times -> Chance of luck is {luck:.2f}% ({self.SIM_TRIALS:,} simulated cheaters)",
+            font_size=24, color=YELLOW
+        ).to_edge(DOWN)
         self.play(Write(final_stat))
         self.wait(3)
         self.clear()
@@ -167,12 +178,22 @@ class ZKP_Final_Narrative_V9(Scene):
         
         waldo_pos = np.array([2.5, 1.5, 0])
         
-        for _ in range(80):
-            pos = [random.uniform(-4.5, 4.5), random.uniform(-2.5, 2.5), 0]
-            if np.linalg.norm(np.array(pos) - waldo_pos) > 0.8:
-                d = Dot(color=random.choice([BLUE, YELLOW, GREEN, PINK, GRAY]), radius=0.06)
-                d.move_to(pos)
-                map_group.add(d)
+        rng = np.random.default_rng(self.WALDO_SEED)
+        candidates = rng.uniform([-4.5, -2.5], [4.5, 2.5], size=(self.WALDO_DISTRACTORS, 2))
+        color_ids = rng.integers(0, 5, size=self.WALDO_DISTRACTORS)
+
+        # Drop distractors near Waldo or overlapping an earlier dot
+        min_gap = 2 * self.WALDO_DOT_RADIUS
+        index = GridIndex(candidates, cell_size=min_gap / np.sqrt(2))
+        keep = index.thin(min_gap) & ~index.within(waldo_pos, 0.8)
+
+        distractors = DotCloud(
+            candidates[keep],
+            [BLUE, YELLOW, GREEN, PINK, GRAY],
+            color_ids[keep],
+            radius=self.WALDO_DOT_RADIUS
+        )
+        map_group.add(distractors)
             
         waldo = Dot(color=RED, radius=0.15).move_to(waldo_pos)
         waldo_ring = Circle(color=WHITE, radius=0.15).move_to(waldo_pos)
@@ -189,14 +210,9 @@ class ZKP_Final_Narrative_V9(Scene):
         hole_center = DOWN * 1.0
         hole_size = 0.4 
 
-        # HUGE rectangles
-        r_top = Rectangle(width=25, height=12, color=BLACK, fill_opacity=1).move_to(hole_center + UP * (6 + hole_size))
-        r_bot = Rectangle(width=25, height=12, color=BLACK, fill_opacity=1).move_to(hole_center + DOWN * (6 + hole_size))
-        r_left = Rectangle(width=12, height=25, color=BLACK, fill_opacity=1).move_to(hole_center + LEFT * (6 + hole_size))
-        r_right = Rectangle(width=12, height=25, color=BLACK, fill_opacity=1).move_to(hole_center + RIGHT * (6 + hole_size))
-        
-        hole_ring = Circle(radius=hole_size, color=WHITE).move_to(hole_center)
-        shield_visual = VGroup(r_top, r_bot, r_left, r_right, hole_ring)
+        shield_visual = geometry_cache.get(
+            "waldo-shield", self.build_shield, center=tuple(hole_center.tolist()), hole_size=hole_size
+        )
         
         # Fade in Shield first
         self.play(FadeIn(shield_visual))
@@ -267,9 +283,7 @@ class ZKP_Final_Narrative_V9(Scene):
         self.add(title)
 
         cave_center = DOWN * 0.5
-        cave = Annulus(inner_radius=1.5, outer_radius=2.5, color=GRAY).rotate(PI).move_to(cave_center)
-        mask = Rectangle(width=2, height=2, color=BLACK, fill_opacity=1).move_to(cave_center + DOWN * 2)
-        cave_visual = Difference(cave, mask, color=GRAY, fill_opacity=0.5)
+        cave_visual = geometry_cache.get("alibaba-cave", self.build_cave, center=tuple(cave_center.tolist()))
         
         door = Line(cave_center + UP*1.5, cave_center + UP*2.5, color=ORANGE, stroke_width=8)
         
@@ -303,6 +317,14 @@ class ZKP_Final_Narrative_V9(Scene):
         
         valid = Text("Verified!", color=GREEN).to_corner(DR)
         self.play(Write(valid))
+
+        # One run alone proves little: a keyless Peggy guesses right half the time
+        cave_runs = simulate("cave", rounds=1, trials=self.SIM_TRIALS, seed=self.SIM_SEED)
+        bluff = Text(
+            f"Without the key: passes {cave_runs.cheat_survival[0]:.1%} of single runs",
+            font_size=20, color=GRAY
+        ).next_to(valid, UP, aligned_edge=RIGHT)
+        self.play(FadeIn(bluff))
         self.wait(3)
         self.clear()
 
@@ -0,0 +1,65 @@
+from collections import namedtuple
+
+import numpy as np
+
+SoundnessCurve = namedtuple(
+    "SoundnessCurve",
+    ["protocol", "trials", "honest_accept", "cheat_survival", "ci_low", "ci_high"],
+)
+
+
+def _coin_flips(rng, shape):
+    # Fair bits from raw random bytes: 8 flips per byte, no float draws
+    size = int(np.prod(shape))
+    packed = np.frombuffer(rng.bytes((size + 7) // 8), dtype=np.uint8)
+    return np.unpackbits(packed)[:size].reshape(shape).astype(bool)
+
+
+def _guess_round(rng, shape, honest):
+    # Victor makes a secret fair choice each round. The honest prover always
+    # answers correctly; a cheater passes only by guessing that choice.
+    challenge = _coin_flips(rng, shape)
+    if honest:
+        return np.ones(shape, dtype=bool)
+    return _coin_flips(rng, shape) == challenge
+
+
+# Both stories reduce to the same guessing game, so they share one round:
+# colorblind - Victor secretly switches the balls or not; a colorblind
+#              cheater can only guess "Switched!" or "Stayed!".
+# cave       - Victor shouts which path to come out of; without the key
+#              Peggy only passes when he names the path she already took.
+PROTOCOLS = {"colorblind": _guess_round, "cave": _guess_round}
+
+
+def _wilson(successes, trials, z):
+    # Wilson score interval for a binomial proportion
+    p = successes / trials
+    denom = 1 + z**2 / trials
+    center = (p + z**2 / (2 * trials)) / denom
+    half = z * np.sqrt(p * (1 - p) / trials + z**2 / (4 * trials**2)) / denom
+    return center - half, center + half
+
+
+def simulate(protocol="colorblind", rounds=10, trials=1_000_000, seed=None, z=1.96, chunk=2**22):
+    # Run trials x rounds protocol rounds for an honest and a cheating prover
+    # as whole-array operations (chunked over trials to bound memory).
+    # cheat_survival[r] is the fraction of cheaters still undetected after
+    # r + 1 rounds, with a Wilson confidence interval at the given z.
+    play_round = PROTOCOLS[protocol]
+    rng = np.random.default_rng(seed)
+    honest_passed = np.zeros(rounds, dtype=np.int64)
+    cheat_passed = np.zeros(rounds, dtype=np.int64)
+
+    per_chunk = max(1, chunk // rounds)
+    for start in range(0, trials, per_chunk):
+        shape = (min(per_chunk, trials - start), rounds)
+        for honest, passed in ((True, honest_passed), (False, cheat_passed)):
+            # A prover survives round r only if every round up to r passed
+            survived = np.logical_and.accumulate(play_round(rng, shape, honest), axis=1)
+            passed += survived.sum(axis=0)
+
+    ci_low, ci_high = _wilson(cheat_passed, trials, z)
+    return SoundnessCurve(
+        protocol, trials, honest_passed / trials, cheat_passed / trials, ci_low, ci_high
+    )
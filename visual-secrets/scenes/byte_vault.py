@@ -0,0 +1,104 @@
+from manim import *
+import numpy as np
+from pathlib import Path
+
+from scenekit.pointcloud import DotCloud
+
+import gf256
+from plotting import to_scene_points
+
+class ByteVault(Scene):
+    # The vault story for one real byte: a byte sampled from a file, its
+    # degree k-1 lock over GF(256) and the shares gf256.py would write for it.
+    THRESHOLD = 3
+    SEED = 5
+
+    def construct(self):
+        # --- CONFIGURATION ---
+        k = self.THRESHOLD
+        rng = np.random.default_rng(self.SEED)
+        payload = Path(__file__).read_bytes()
+        offset = int(rng.integers(len(payload)))
+        secret = payload[offset]
+
+        # The lock for this byte, evaluated at every x of the field
+        coeffs = np.empty((k, 1), dtype=np.uint8)
+        coeffs[0] = secret
+        coeffs[1:] = gf256.random_bytes((k - 1, 1), rng)
+        field_x = np.arange(256)
+        field_y = np.array([gf256.eval_byte_polys(coeffs, x)[0] for x in field_x])
+
+        x_coords = [40, 120, 200]
+        names = ["Alice", "Bob", "Charlie"]
+        colors = [YELLOW, ORANGE, PURPLE]
+
+        # --- SCENE 1: THE SECRET ---
+        self.next_section("The Secret")
+
+        axes = Axes(
+            x_range=[0, 256, 32],
+            y_range=[0, 256, 32],
+            y_length=5.5,
+            axis_config={"include_numbers": False, "color": GREY},
+            tips=True
+        ).shift(DOWN * 0.3)
+
+        # Manual tick labels, as in VisualThresholdStory
+        x_labels = VGroup(*[
+            Text(str(x), font_size=18).next_to(axes.c2p(x, 0), DOWN)
+            for x in range(64, 257, 64)
+        ])
+
+        char = chr(secret) if 32 < secret < 127 else "·"
+        source_text = Text(f"Byte {offset} of {Path(__file__).name}", font_size=24).to_corner(UL)
+        secret_dot = Dot(axes.c2p(0, secret), color=RED, radius=0.15).set_z_index(10)
+        secret_label = Text(f"Secret Byte: 0x{secret:02X} '{char}'", font_size=30, color=RED).next_to(secret_dot, RIGHT)
+
+        self.play(Create(axes), FadeIn(x_labels), Write(source_text))
+        self.play(FadeIn(secret_dot), Write(secret_label))
+        self.wait(2)
+
+        # --- SCENE 2: THE LOCK ---
+        self.next_section("The Lock")
+
+        points = to_scene_points(axes, field_x, field_y)
+        lock_path = VMobject(stroke_color=BLUE, stroke_width=1, stroke_opacity=0.25)
+        lock_path.set_points_as_corners(points)
+        lock_dots = DotCloud(points, [BLUE], radius=0.03)
+        curve_label = Text(f"Degree {k - 1} Lock over GF(256)", font_size=24, color=BLUE).to_corner(UR)
+        noise_text = Text("No curve to see: every x maps to a scrambled byte", font_size=20, color=GREY).next_to(curve_label, DOWN, aligned_edge=RIGHT)
+
+        self.play(FadeOut(secret_label))
+        self.play(Create(lock_path), FadeIn(lock_dots), FadeIn(curve_label), run_time=2)
+        self.play(Write(noise_text))
+        self.wait(1)
+
+        # --- SCENE 3: THE KEYS ---
+        self.next_section("The Keys")
+
+        keys = VGroup()
+        key_labels = VGroup()
+        for x, name, col in zip(x_coords, names, colors):
+            y = int(field_y[x])
+            dot = Dot(axes.c2p(x, y), color=col, radius=0.12).set_z_index(5)
+            lbl = Text(f"{name}\n({x}, 0x{y:02X})", font_size=16, color=col, line_spacing=1)
+            lbl.next_to(dot, UP if y < 200 else DOWN)
+            keys.add(dot)
+            key_labels.add(lbl)
+
+        self.play(FadeIn(keys), Write(key_labels))
+        self.wait(1)
+        self.play(FadeOut(secret_dot), FadeOut(lock_path), FadeOut(lock_dots), FadeOut(curve_label), FadeOut(noise_text))
+        self.wait(1)
+
+        # --- SCENE 4: SUCCESS ---
+        self.next_section("Success")
+
+        # The keys alone restore the byte, through the file splitter's code
+        restored = int(gf256.combine_bytes(x_coords, field_y[x_coords][:, None])[0])
+        restored_label = Text(f"Restored Byte: 0x{restored:02X} '{chr(restored) if 32 < restored < 127 else '·'}'", font_size=30, color=RED).next_to(secret_dot, RIGHT)
+        success_text = Text(f"{k} Keys = Access Granted", font_size=24, color=GREEN).next_to(source_text, DOWN, aligned_edge=LEFT)
+
+        self.play(FadeIn(lock_dots.set_color(GREEN)), Write(success_text))
+        self.play(FadeIn(secret_dot), FadeIn(restored_label))
+        self.wait(3)
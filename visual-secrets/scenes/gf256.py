@@ -0,0 +1,287 @@
+import argparse
+import mmap
+import os
+import struct
+import sys
+import time
+from functools import lru_cache
+from pathlib import Path
+
+import numpy as np
+
+# --- FIELD TABLES ---
+# GF(2^8) with the AES polynomial x^8 + x^4 + x^3 + x + 1 and generator 3.
+# Addition is XOR; multiplication goes through log/antilog tables, and
+# MUL[c] is the whole "multiply by c" map, so scaling a chunk by a constant
+# is one table lookup per byte.
+EXP = np.zeros(512, dtype=np.uint8)
+LOG = np.zeros(256, dtype=np.int64)
+_value = 1
+for _power in range(255):
+    EXP[_power] = _value
+    LOG[_value] = _power
+    _value ^= (_value << 1) ^ (0x11B if _value & 0x80 else 0)
+EXP[255:510] = EXP[:255]
+
+_logs = LOG[1:, None] + LOG[None, 1:]
+MUL = np.zeros((256, 256), dtype=np.uint8)
+MUL[1:, 1:] = EXP[_logs]
+del _value, _power, _logs
+
+
+@lru_cache(maxsize=256)
+def pair_table(c):
+    # "Multiply by c" for two bytes at once, indexed by a uint16. Halves the
+    # number of lookups on long buffers; the byte order does not matter since
+    # both bytes get the same map.
+    pairs = np.arange(2**16)
+    return (MUL[c][pairs >> 8].astype(np.uint16) << 8) | MUL[c][pairs & 0xFF]
+
+# --- SHARE FILES ---
+# Header: magic, format version, threshold k, share x-coordinate, a random
+# id shared by every file of one split, payload length
+MAGIC = b"GFSS"
+VERSION = 2
+HEADER = struct.Struct(">4sBBB16sQ")
+# Bytes per mmap window. Small enough that the k coefficient rows and the
+# share being evaluated stay in the CPU cache while all n shares are
+# computed; table lookups run about twice as fast as over 16 MiB windows.
+CHUNK = 64 * 2**10
+
+
+def inverse(a):
+    if a == 0:
+        raise ZeroDivisionError("0 has no inverse in GF(256).")
+    return int(EXP[255 - LOG[a]])
+
+
+def random_bytes(shape, rng=None):
+    # Coefficient bytes from os.urandom; a seeded numpy Generator only for
+    # reproducible renders, never for real payloads
+    if rng is not None:
+        return rng.integers(0, 256, size=shape, dtype=np.uint8)
+    return np.frombuffer(os.urandom(int(np.prod(shape))), dtype=np.uint8).reshape(shape)
+
+
+def fill_random(out, source=None, rng=None):
+    # random_bytes written into an existing contiguous uint8 array. source
+    # is an unbuffered /dev/urandom file to read into out directly; without
+    # it (no /dev/urandom, e.g. Windows) the bytes come from os.urandom.
+    if rng is not None:
+        out[...] = rng.integers(0, 256, size=out.shape, dtype=np.uint8)
+    elif source is not None:
+        view = memoryview(out).cast("B")
+        filled = 0
+        while filled < len(view):
+            filled += source.readinto(view[filled:])
+    else:
+        out[...] = np.frombuffer(os.urandom(out.size), dtype=np.uint8).reshape(out.shape)
+    return out
+
+
+def _urandom():
+    try:
+        return open("/dev/urandom", "rb", buffering=0)
+    except OSError:
+        return None
+
+
+def _scale_add(c, values, addend, out, scratch):
+    # out = c * values + addend. Buffers whose length is a multiple of 8 are
+    # scaled two bytes per lookup and XORed eight bytes at a time; c = 1
+    # (the share at x=1, every Lagrange weight of 1) needs no lookup at all.
+    if c == 1:
+        np.bitwise_xor(values, addend, out=out)
+        return
+    if len(values) % 8:
+        np.take(MUL[c], values, out=scratch, mode="wrap")
+        np.bitwise_xor(scratch, addend, out=out)
+        return
+    np.take(pair_table(c), values.view(np.uint16), out=scratch.view(np.uint16), mode="wrap")
+    np.bitwise_xor(scratch.view(np.uint64), addend.view(np.uint64), out=out.view(np.uint64))
+
+
+def eval_byte_polys(coeffs, x, out=None, scratch=None):
+    # Horner over GF(256) for every column of coeffs (k rows, constant term
+    # first) at one x. Returns one byte per column.
+    acc = np.empty_like(coeffs[-1]) if out is None else out
+    acc[:] = coeffs[-1]
+    scratch = np.empty_like(acc) if scratch is None else scratch
+    for c in coeffs[-2::-1]:
+        _scale_add(x, acc, c, acc, scratch)
+    return acc
+
+
+def lagrange_weights(xs):
+    # w_i = prod_{j != i} x_j / (x_j - x_i); subtraction is XOR in GF(2^8)
+    xs = [int(x) for x in xs]
+    if len(set(xs)) != len(xs) or not all(0 < x < 256 for x in xs):
+        raise ValueError("Share x-coordinates must be distinct and in 1..255.")
+    weights = []
+    for i, xi in enumerate(xs):
+        w = 1
+        for j, xj in enumerate(xs):
+            if i != j:
+                w = int(MUL[w, MUL[xj, inverse(xj ^ xi)]])
+        weights.append(w)
+    return weights
+
+
+def split_bytes(data, k, n, xs=None, rng=None):
+    # Split a byte string or uint8 array into n shares with threshold k.
+    # Returns (xs, shares) with shares of shape (n, len(data)).
+    if not 1 <= k <= n <= 255:
+        raise ValueError(f"Need 1 <= k <= n <= 255, got k={k}, n={n}.")
+    xs = np.arange(1, n + 1) if xs is None else np.asarray(xs)
+    if len(xs) != n or len(np.unique(xs)) != n or not np.all((xs > 0) & (xs < 256)):
+        raise ValueError("Need n distinct share x-coordinates in 1..255.")
+    secret = np.frombuffer(data, dtype=np.uint8) if isinstance(data, bytes) else np.asarray(data, np.uint8)
+    coeffs = np.empty((k, len(secret)), dtype=np.uint8)
+    coeffs[0] = secret
+    coeffs[1:] = random_bytes((k - 1, len(secret)), rng)
+    return xs, np.stack([eval_byte_polys(coeffs, x) for x in xs])
+
+
+def combine_bytes(xs, shares):
+    # Recover the secret bytes from k rows of shares
+    shares = np.asarray(shares, dtype=np.uint8)
+    result = np.zeros(shares.shape[1], dtype=np.uint8)
+    scratch = np.empty_like(result)
+    for w, share in zip(lagrange_weights(xs), shares):
+        _scale_add(w, share, result, result, scratch)
+    return result
+
+
+# --- STREAMING ---
+def _mapped(path):
+    # Read-only mmap of a file, or None when it is empty (mmap refuses those)
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return None
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+def _padded(size):
+    # Buffers are rounded up to 8 bytes so every window takes the fast path
+    return size + -size % 8
+
+
+def split_file(path, k, n, out_dir, chunk=CHUNK, rng=None):
+    # Stream path into n share files <name>.<x>.share under out_dir. Input
+    # is read through mmap one window at a time; the random coefficients are
+    # read straight into the reused coefficient buffer and all n shares of a
+    # window are evaluated while it is in cache. Memory stays at about
+    # (k + 2) * chunk whatever the file size.
+    if not 1 <= k <= n <= 255:
+        raise ValueError(f"Need 1 <= k <= n <= 255, got k={k}, n={n}.")
+    path, out_dir = Path(path), Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    share_paths = [out_dir / f"{path.name}.{x:03d}.share" for x in range(1, n + 1)]
+    split_id = bytes(random_bytes(16, rng))
+    length = path.stat().st_size
+    outputs = [open(p, "wb") for p in share_paths]
+    urandom = None if rng is not None else _urandom()
+    try:
+        for x, f in enumerate(outputs, start=1):
+            f.write(HEADER.pack(MAGIC, VERSION, k, x, split_id, length))
+        source = _mapped(path)
+        if source is not None:
+            with source:
+                width = _padded(min(chunk, len(source)))
+                coeffs = np.zeros((k, width), dtype=np.uint8)
+                share = np.empty(width, dtype=np.uint8)
+                scratch = np.empty(width, dtype=np.uint8)
+                for offset in range(0, len(source), chunk):
+                    size = min(chunk, len(source) - offset)
+                    padded = _padded(size)
+                    window = coeffs[:, :padded]
+                    window[0, :size] = np.frombuffer(source, dtype=np.uint8, count=size, offset=offset)
+                    window[0, size:] = 0
+                    for row in window[1:]:
+                        fill_random(row, urandom, rng)
+                    for x, f in enumerate(outputs, start=1):
+                        f.write(eval_byte_polys(window, x, out=share[:padded], scratch=scratch[:padded])[:size])
+    finally:
+        if urandom is not None:
+            urandom.close()
+        for f in outputs:
+            f.close()
+    return share_paths
+
+
+def read_header(source):
+    # (k, x, split id, payload length) of a share file
+    if len(source) < HEADER.size:
+        raise ValueError("Not a GF(256) share file.")
+    magic, version, k, x, split_id, length = HEADER.unpack_from(source)
+    if magic != MAGIC or version != VERSION:
+        raise ValueError("Not a GF(256) share file.")
+    return k, x, split_id, length
+
+
+def combine_files(share_paths, out_path, chunk=CHUNK):
+    # Stream k share files back into the original payload
+    sources = [_mapped(p) for p in share_paths]
+    if any(s is None for s in sources):
+        raise ValueError("Empty share file.")
+    try:
+        headers = [read_header(s) for s in sources]
+        k, _, split_id, length = headers[0]
+        if any((h[0], h[2], h[3]) != (k, split_id, length) for h in headers):
+            raise ValueError("Share files come from different splits.")
+        if len(sources) < k:
+            raise ValueError(f"Need {k} shares, got {len(sources)}.")
+        sources, headers = sources[:k], headers[:k]
+        if any(len(s) != HEADER.size + length for s in sources):
+            raise ValueError("Share file is truncated or has trailing data.")
+
+        weights = lagrange_weights([h[1] for h in headers])
+        padded = _padded(min(chunk, length))
+        result = np.empty(padded, dtype=np.uint8)
+        window = np.zeros(padded, dtype=np.uint8)
+        scratch = np.empty(padded, dtype=np.uint8)
+        with open(out_path, "wb") as out:
+            for offset in range(HEADER.size, HEADER.size + length, chunk):
+                size = min(chunk, HEADER.size + length - offset)
+                acc, share, tmp = result[:_padded(size)], window[:_padded(size)], scratch[:_padded(size)]
+                acc[:] = 0
+                for w, source in zip(weights, sources):
+                    share[:size] = np.frombuffer(source, dtype=np.uint8, count=size, offset=offset)
+                    _scale_add(w, share, acc, acc, tmp)
+                out.write(acc[:size])
+    finally:
+        for s in sources:
+            if s is not None:
+                s.close()
+    return length
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Split a file into k-of-n Shamir share files over GF(256), or combine them back."
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+    split_cmd = commands.add_parser("split", help="write n share files")
+    split_cmd.add_argument("file")
+    split_cmd.add_argument("-k", "--threshold", type=int, required=True)
+    split_cmd.add_argument("-n", "--shares", type=int, required=True)
+    split_cmd.add_argument("-o", "--out-dir", default=".")
+    combine_cmd = commands.add_parser("combine", help="restore the file from k share files")
+    combine_cmd.add_argument("shares", nargs="+")
+    combine_cmd.add_argument("-o", "--output", required=True)
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    if args.command == "split":
+        paths = split_file(args.file, args.threshold, args.shares, args.out_dir)
+        size = os.path.getsize(args.file)
+        print(f"{len(paths)} shares written to {args.out_dir}")
+    else:
+        size = combine_files(args.shares, args.output)
+        print(f"restored {args.output}")
+    elapsed = time.perf_counter() - start
+    print(f"{size / 2**20:.1f} MiB in {elapsed:.2f}s ({size / 2**20 / max(elapsed, 1e-9):.0f} MiB/s)", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+import numpy as np
+
+
+def barycentric_weights(nodes):
+    # w_i = 1 / prod_{j != i} (x_i - x_j), built in log space so hundreds of
+    # nodes neither overflow nor underflow. Only ratios of the weights matter
+    # in the barycentric formula, so they are normalised to max |w| = 1.
+    nodes = np.asarray(nodes, dtype=float)
+    if len(np.unique(nodes)) != len(nodes):
+        raise ValueError("Interpolation nodes must be distinct.")
+    diffs = nodes[:, None] - nodes[None, :]
+    np.fill_diagonal(diffs, 1.0)
+    log_mag = -np.log(np.abs(diffs)).sum(axis=1)
+    sign = np.where(np.count_nonzero(diffs < 0, axis=1) % 2, -1.0, 1.0)
+    return sign * np.exp(log_mag - log_mag.max())
+
+
+class Barycentric:
+    # Second-form barycentric interpolant through (nodes, values).
+    # Every method takes a whole array of sample points, so a curve with
+    # s samples and k shareholders costs one O(s * k) NumPy evaluation.
+    def __init__(self, nodes, values):
+        self.nodes = np.asarray(nodes, dtype=float)
+        self.values = np.asarray(values, dtype=float)
+        self.weights = barycentric_weights(self.nodes)
+
+    def _terms(self, t):
+        # Returns w_j / (t - x_j) per sample, plus the index of the node each
+        # sample sits exactly on (or -1), where the formula is 0/0.
+        t = np.asarray(t, dtype=float)
+        diffs = t[..., None] - self.nodes
+        exact = diffs == 0
+        hit = np.where(exact.any(axis=-1), exact.argmax(axis=-1), -1)
+        diffs[exact] = 1.0
+        return self.weights / diffs, hit
+
+    def __call__(self, t):
+        terms, hit = self._terms(t)
+        result = (terms @ self.values) / terms.sum(axis=-1)
+        return np.where(hit >= 0, self.values[hit], result)
+
+    def basis(self, i, t):
+        # Lagrange basis polynomial l_i: 1 at node i, 0 at every other node
+        terms, hit = self._terms(t)
+        result = terms[..., i] / terms.sum(axis=-1)
+        return np.where(hit >= 0, (hit == i).astype(float), result)
+
+    def basis_func(self, i):
+        # y_i * l_i(x) as a vectorized function for axes.plot(use_vectorized=True)
+        return lambda x: self.values[i] * self.basis(i, x)
+
+
+class GhostFamily:
+    # Every degree k-1 polynomial through k-1 known shares, indexed by the
+    # value s it takes at x=0. The family is affine in s:
+    #     P_s(x) = base(x) + s * direction(x)
+    # base is the interpolant with s = 0 and direction is the Lagrange basis
+    # of the node x=0, so one barycentric weight table covers every ghost.
+    # The evaluation is stable, but the family is only as well conditioned as
+    # its nodes: with many evenly spaced shares the ghosts swing by orders of
+    # magnitude between them, so large k needs Chebyshev-like known_x.
+    def __init__(self, known_x, known_y):
+        self.nodes = np.concatenate([[0.0], np.asarray(known_x, dtype=float)])
+        self.base = Barycentric(self.nodes, np.concatenate([[0.0], known_y]))
+
+    def coeffs(self, secrets):
+        # (m, k) coefficient rows, constant term first. One Vandermonde solve
+        # with two right-hand sides; only well conditioned for small k.
+        rhs = np.zeros((len(self.nodes), 2))
+        rhs[:, 0] = self.base.values
+        rhs[0, 1] = 1.0
+        base, direction = np.linalg.solve(np.vander(self.nodes, increasing=True), rhs).T
+        return base + np.asarray(secrets, dtype=float)[:, None] * direction
+
+    def evaluate(self, secrets, t):
+        # (m, len(t)) samples of every ghost curve in one outer product
+        base = self.base(t)
+        direction = self.base.basis(0, t)
+        return base + np.outer(secrets, direction)
+
+    def band(self, s_min, s_max, t):
+        # Lower/upper envelope of all ghosts with s in [s_min, s_max]
+        edges = self.evaluate([s_min, s_max], t)
+        return edges.min(axis=0), edges.max(axis=0)
@@ -1,10 +1,16 @@
 from manim import *
-import numpy as np
+
+from scenekit.glyphs import cached_text
+
+import shamir_field
+from interpolation import Barycentric
+from plotting import plot_adaptive
 
 class MathDeepDive(Scene):
     def construct(self):
         # --- CONFIGURATION ---
         SECRET = 3
+        COEFFS = [SECRET, -0.5, 0.15]
         # The true polynomial: P(x) = 3 - 0.5x + 0.15x^2
         def true_poly(x):
             return SECRET - 0.5 * x + 0.15 * x**2
@@ -12,6 +18,7 @@ class MathDeepDive(Scene):
         # The points for Alice, Bob, Charlie
         x_vals = [-2, 2, 4]
         y_vals = [true_poly(x) for x in x_vals]
+        field_shares = shamir_field.share_points(COEFFS, x_vals)
         colors = [YELLOW, ORANGE, PURPLE]
         names = ["Alice", "Bob", "Charlie"]
 
@@ -48,13 +55,13 @@ class MathDeepDive(Scene):
         self.play(Write(question))
         self.wait(1)
 
-        # Formula text
+        # Formula text; the second "+" is a copy of the first from the cache
         formula = VGroup(
             Text("P(x) =", font_size=40),
             Text("Alice_Wave", color=YELLOW, font_size=30),
-            Text("+", font_size=30),
+            cached_text("+", font_size=30),
             Text("Bob_Wave", color=ORANGE, font_size=30),
-            Text("+", font_size=30),
+            cached_text("+", font_size=30),
             Text("Charlie_Wave", color=PURPLE, font_size=30)
         ).arrange(RIGHT, buff=0.2).to_edge(UP)
 
@@ -72,30 +79,23 @@ class MathDeepDive(Scene):
         self.play(Write(math_label))
 
         basis_curves = []
-        
-        def make_basis_func(i):
-            def func(x):
-                result = y_vals[i]
-                for j in range(len(x_vals)):
-                    if i != j:
-                        numerator = x - x_vals[j]
-                        denominator = x_vals[i] - x_vals[j]
-                        result *= (numerator / denominator)
-                return result
-            return func
-
-        for i in range(3):
-            basis_func = make_basis_func(i)
+
+        # One barycentric interpolant serves every basis wave; each curve is a
+        # single vectorized evaluation over all sample points.
+        interp = Barycentric(x_vals, y_vals)
+
+        for i in range(len(x_vals)):
+            basis_func = interp.basis_func(i)
             color = colors[i]
             
-            curve = axes.plot(basis_func, x_range=[-4, 5], color=color, stroke_width=3)
+            curve = plot_adaptive(axes, basis_func, x_range=[-4, 5], color=color, stroke_width=3)
             
             self.play(Create(curve), run_time=1.5)
             self.play(Indicate(keys[i][0], scale_factor=2, color=WHITE))
             
             # Show zeros
             zeros = VGroup()
-            for j in range(3):
+            for j in range(len(x_vals)):
                 if i != j:
                     z_dot = Dot(axes.c2p(x_vals[j], 0), color=color, radius=0.1)
                     zeros.add(z_dot)
@@ -125,7 +125,8 @@ class MathDeepDive(Scene):
             Write(sum_text)
         )
 
-        final_curve = axes.plot(true_poly, color=GREEN, stroke_width=6)
+        # The sum of the basis waves is the interpolant itself
+        final_curve = plot_adaptive(axes, interp, color=GREEN, stroke_width=6)
         
         self.play(
             ReplacementTransform(VGroup(*basis_curves), final_curve),
@@ -135,7 +136,8 @@ class MathDeepDive(Scene):
         # Secret Reveal
         secret_dot = Dot(axes.c2p(0, SECRET), color=RED, radius=0.2).set_z_index(20)
         secret_arrow = Arrow(start=axes.c2p(2, 6), end=axes.c2p(0.1, 3.1), color=RED)
-        secret_lbl = Text("Secret Restored: 3", font_size=24, color=RED).next_to(secret_arrow, UP)
+        restored = shamir_field.reconstruct(x_vals, field_shares)
+        secret_lbl = Text(f"Secret Restored: {restored}", font_size=24, color=RED).next_to(secret_arrow, UP)
 
         self.play(FadeIn(secret_dot), Create(secret_arrow), Write(secret_lbl))
         self.wait(3)
\ No newline at end of file
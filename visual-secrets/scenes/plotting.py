@@ -0,0 +1,102 @@
+import heapq
+
+import numpy as np
+from manim import VMobject
+
+
+# Max distance (scene units) between a plotted chord and the true curve.
+# The 1080p frame is 8 units tall, so 0.005 stays under one pixel.
+ADAPTIVE_TOL = 0.005
+
+
+def to_scene_points(axes, xs, ys):
+    # Vectorized axes.c2p for the linear Axes used in these scenes
+    origin = axes.c2p(0, 0)
+    x_unit = axes.c2p(1, 0) - origin
+    y_unit = axes.c2p(0, 1) - origin
+    xs = np.asarray(xs, dtype=float)
+    ys = np.asarray(ys, dtype=float)
+    return origin + xs[..., None] * x_unit + ys[..., None] * y_unit
+
+
+def _corner_curves(points):
+    # Straight cubic bezier segments between consecutive rows of points,
+    # flattened to the 4-points-per-curve layout a VMobject stores.
+    start, end = points[..., :-1, :], points[..., 1:, :]
+    step = (end - start) / 3
+    return np.stack([start, start + step, end - step, end], axis=-2)
+
+
+def curve_family(axes, xs, ys_rows, **kwargs):
+    # Many curves sampled at the same xs as ONE VMobject. Segments are stored
+    # column by column, so Create sweeps every curve left to right at once,
+    # like it would for a VGroup of separate graphs.
+    points = to_scene_points(axes, xs, ys_rows)
+    curves = _corner_curves(points).swapaxes(0, 1)
+    family = VMobject(**kwargs)
+    family.set_points(curves.reshape(-1, 3))
+    return family
+
+
+def band_between(axes, xs, lower, upper, **kwargs):
+    # Closed, fillable region between two sampled curves
+    outline = np.concatenate([
+        to_scene_points(axes, xs, upper),
+        to_scene_points(axes, xs[::-1], lower[::-1]),
+    ])
+    band = VMobject(**kwargs)
+    band.set_points_as_corners(np.concatenate([outline, outline[:1]]))
+    return band
+
+
+def adaptive_xs(axes, func, x_min, x_max, tol=ADAPTIVE_TOL, initial=9, max_rounds=12):
+    # Curvature-adaptive sample positions: an interval is halved only while the
+    # curve's midpoint sits more than tol away from the chord's midpoint, so
+    # near-linear stretches keep few anchors and bends get many. func must be
+    # vectorized; if it returns several rows (a curve family) the worst row
+    # decides, giving one shared set of xs.
+    xs = np.linspace(x_min, x_max, initial)
+    ys = np.asarray(func(xs), dtype=float)
+    todo = np.arange(len(xs) - 1)
+    for _ in range(max_rounds):
+        if len(todo) == 0:
+            break
+        mids = (xs[todo] + xs[todo + 1]) / 2
+        mid_ys = np.asarray(func(mids), dtype=float)
+        chord_mid = (
+            to_scene_points(axes, xs[todo], ys[..., todo])
+            + to_scene_points(axes, xs[todo + 1], ys[..., todo + 1])
+        ) / 2
+        err = np.linalg.norm(to_scene_points(axes, mids, mid_ys) - chord_mid, axis=-1)
+        split = err.reshape(-1, len(todo)).max(axis=0) > tol
+
+        xs = np.insert(xs, todo[split] + 1, mids[split])
+        ys = np.insert(ys, todo[split] + 1, mid_ys[..., split], axis=-1)
+        # Both halves of every split interval get checked next round
+        left = todo[split] + np.arange(np.count_nonzero(split))
+        todo = np.sort(np.concatenate([left, left + 1]))
+    return xs
+
+
+def plot_adaptive(axes, func, x_range=None, tol=ADAPTIVE_TOL, **kwargs):
+    # Drop-in for axes.plot(func, ...) with curvature-adaptive anchors
+    x_min, x_max = (x_range or axes.x_range)[:2]
+    xs = adaptive_xs(axes, func, x_min, x_max, tol)
+    curve = VMobject(**kwargs)
+    curve.set_points(_corner_curves(to_scene_points(axes, xs, func(xs))).reshape(-1, 3))
+    return curve
+
+
+def stack_labels(lefts, rights, gap=0.05):
+    # Tier index per label such that labels sharing a tier never overlap
+    # horizontally (interval partitioning: one sort plus a heap, O(n log n)).
+    # Tiers are reused lowest-first, so rows stay as few as the crowding needs.
+    tiers = np.empty(len(lefts), dtype=int)
+    busy = []   # (right edge, tier) of the last label placed in each tier
+    free = []   # tiers whose last label ends left of the current one
+    for i in np.argsort(lefts, kind="stable"):
+        while busy and busy[0][0] + gap <= lefts[i]:
+            heapq.heappush(free, heapq.heappop(busy)[1])
+        tiers[i] = heapq.heappop(free) if free else len(busy)
+        heapq.heappush(busy, (rights[i], tiers[i]))
+    return tiers
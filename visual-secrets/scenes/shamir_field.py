@@ -0,0 +1,144 @@
+import os
+from collections import OrderedDict, namedtuple
+from fractions import Fraction
+
+import numpy as np
+
+# --- FIELD PARAMETERS ---
+# Mersenne prime 2^31 - 1. Any product of two field elements is below 2^62,
+# so every step of split/reconstruct stays inside int64 NumPy arithmetic.
+PRIME = 2**31 - 1
+
+
+def to_field(value, p=PRIME):
+    # Map an int, Fraction or decimal literal (0.15 -> 3/20) into GF(p) exactly.
+    if isinstance(value, float):
+        value = Fraction(str(value))
+    value = Fraction(value)
+    return value.numerator * pow(value.denominator, -1, p) % p
+
+
+def random_elements(shape, p=PRIME, rng=None):
+    # Uniform field elements. Without an rng the bytes come from os.urandom;
+    # pass a seeded numpy Generator only for reproducible renders.
+    if rng is not None:
+        return rng.integers(0, p, size=shape, dtype=np.int64)
+    size = int(np.prod(shape))
+    raw = np.frombuffer(os.urandom(8 * size), dtype=np.uint64)
+    return (raw % np.uint64(p)).astype(np.int64).reshape(shape)
+
+
+def eval_polys(coeffs, xs, p=PRIME):
+    # Horner evaluation of m polynomials (rows of coeffs, constant term first)
+    # at n points in one pass. Returns an (m, n) array.
+    coeffs = np.asarray(coeffs, dtype=np.int64) % p
+    xs = np.asarray(xs, dtype=np.int64) % p
+    acc = np.repeat(coeffs[:, -1:], len(xs), axis=1)
+    for c in range(coeffs.shape[1] - 2, -1, -1):
+        acc = (acc * xs + coeffs[:, c:c + 1]) % p
+    return acc
+
+
+def share_points(coeffs, xs, p=PRIME):
+    # Exact shares of a single polynomial with rational coefficients,
+    # e.g. the vault curve 3 - 0.5x + 0.15x^2.
+    field_coeffs = [[to_field(c, p) for c in coeffs]]
+    return eval_polys(field_coeffs, xs, p)[0]
+
+
+def lagrange_weights(xs, p=PRIME):
+    # w_i = prod_{j != i} x_j / (x_j - x_i), so that P(0) = sum_i w_i * y_i.
+    xs = [int(x) % p for x in xs]
+    if len(set(xs)) != len(xs) or 0 in xs:
+        raise ValueError("Share x-coordinates must be distinct and non-zero.")
+    weights = []
+    for i, xi in enumerate(xs):
+        num, den = 1, 1
+        for j, xj in enumerate(xs):
+            if i != j:
+                num = num * xj % p
+                den = den * (xj - xi) % p
+        weights.append(num * pow(den, -1, p) % p)
+    return np.array(weights, dtype=np.int64)
+
+
+# --- LAGRANGE WEIGHT CACHE ---
+CacheInfo = namedtuple("CacheInfo", ["hits", "misses", "maxsize", "currsize"])
+
+
+class LagrangeCache:
+    # Bounded LRU of weight tables keyed by the *set* of share x-coordinates.
+    # A quorum that reconstructs again (Alice/Bob/Charlie at -2, 2, 4) skips
+    # the O(k^2) table build and pays one O(k) dot product per secret.
+    def __init__(self, maxsize=256):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._tables = OrderedDict()
+
+    def weights(self, xs, p=PRIME):
+        xs = np.asarray(xs, dtype=np.int64) % p
+        key = (p, tuple(sorted(xs.tolist())))
+        table = self._tables.get(key)
+        if table is None:
+            self.misses += 1
+            table = lagrange_weights(key[1], p)
+            # Handed out as is on the sorted path: read-only, so a caller
+            # cannot corrupt later reconstructions for this quorum
+            table.flags.writeable = False
+            self._tables[key] = table
+            while len(self._tables) > self.maxsize:
+                self._tables.popitem(last=False)
+        else:
+            self.hits += 1
+            self._tables.move_to_end(key)
+
+        # Tables are stored in sorted x order; reorder for the caller's shares
+        sorted_xs = np.array(key[1], dtype=np.int64)
+        if np.array_equal(sorted_xs, xs):
+            return table
+        return table[np.searchsorted(sorted_xs, xs)]
+
+    def info(self):
+        return CacheInfo(self.hits, self.misses, self.maxsize, len(self._tables))
+
+    def clear(self):
+        self.hits = 0
+        self.misses = 0
+        self._tables.clear()
+
+
+lagrange_cache = LagrangeCache()
+
+
+def split(secrets, k, n, p=PRIME, xs=None, rng=None):
+    # Split every secret into n shares with threshold k.
+    # Returns (xs, shares) where shares has shape (len(secrets), n).
+    if not 1 <= k <= n:
+        raise ValueError(f"Need 1 <= k <= n, got k={k}, n={n}.")
+    secrets = np.atleast_1d(np.asarray(secrets, dtype=np.int64)) % p
+    if xs is None:
+        xs = np.arange(1, n + 1, dtype=np.int64)
+    xs = np.asarray(xs, dtype=np.int64) % p
+    if len(xs) != n or len(np.unique(xs)) != n or np.any(xs == 0):
+        raise ValueError("Need n distinct, non-zero share x-coordinates.")
+
+    coeffs = np.empty((len(secrets), k), dtype=np.int64)
+    coeffs[:, 0] = secrets
+    coeffs[:, 1:] = random_elements((len(secrets), k - 1), p, rng)
+    return xs, eval_polys(coeffs, xs, p)
+
+
+def reconstruct(xs, shares, p=PRIME):
+    # Recover P(0) for every row of shares (shape (m, k), or (k,) for one secret).
+    shares = np.asarray(shares, dtype=np.int64) % p
+    single = shares.ndim == 1
+    shares = np.atleast_2d(shares)
+    if shares.shape[1] != len(xs):
+        raise ValueError("Got a different number of shares and x-coordinates.")
+
+    weights = lagrange_cache.weights(xs, p)
+    acc = np.zeros(shares.shape[0], dtype=np.int64)
+    for j, w in enumerate(weights):
+        acc = (acc + shares[:, j] * w) % p
+    return int(acc[0]) if single else acc
@@ -0,0 +1,190 @@
+from manim import *
+import numpy as np
+
+from scenekit.glyphs import cached_text
+from scenekit.pointcloud import DotCloud
+
+import vss
+from interpolation import Barycentric, GhostFamily
+from plotting import adaptive_xs, band_between, curve_family, plot_adaptive, stack_labels, to_scene_points
+
+class ThresholdStory(Scene):
+    # VisualThresholdStory for any threshold k and committee size n.
+    # Subclass and change THRESHOLD / SHAREHOLDERS for other committees.
+    THRESHOLD = 3
+    SHAREHOLDERS = 12
+    SECRET_Y = 3
+    SEED = 7
+
+    def construct(self):
+        # --- CONFIGURATION ---
+        k, n = self.THRESHOLD, self.SHAREHOLDERS
+        SECRET_Y = self.SECRET_Y
+        rng = np.random.default_rng(self.SEED)
+
+        # The lock is the degree k-1 polynomial through k Chebyshev-spaced
+        # control points, shifted so one of them sits at (0, secret). The
+        # spacing keeps it inside the frame even for hundreds of shareholders,
+        # but only between the outermost control points: just outside them a
+        # high-degree polynomial shoots off, so every curve is drawn on span.
+        cheb = 4.3 * np.cos(np.pi * (np.arange(k) + 0.5) / k)
+        at_zero = np.argmin(np.abs(cheb + 0.5))
+        control_x = cheb - cheb[at_zero]
+        control_y = 4.5 + 2 * np.sin(1.3 * control_x) + rng.normal(0, 0.3, k)
+        control_y[at_zero] = SECRET_Y
+        lock = Barycentric(control_x, control_y)
+        span = [control_x.min(), control_x.max()]
+
+        # k-1 shareholders hold the control points other than the secret and
+        # the rest sit evenly in between. Those k-1 keys are the ones the Fail
+        # section interpolates through: Chebyshev-spaced, so the ghost family
+        # stays well conditioned for any k, where evenly spaced keys would not.
+        anchor_x = np.delete(control_x, at_zero)
+        spread_x = np.linspace(*span, n - k + 3)[1:-1]
+        spread_x[np.abs(spread_x) < 1e-6] += 0.05
+        order = np.argsort(np.concatenate([anchor_x, spread_x]), kind="stable")
+        share_x = np.concatenate([anchor_x, spread_x])[order]
+        share_y = lock(share_x)
+        rank = np.argsort(order)
+
+        # A real dealing of the same secret: exact GF(Q) shares with Feldman
+        # commitments, so the whole committee's keys are checked in one batch.
+        # Those shares are field elements and cannot be plotted; the picture
+        # draws the float lock above instead.
+        field_xs, field_shares, commitments = vss.deal(SECRET_Y, k, n, rng=rng)
+        verified = vss.batch_verify(field_xs, field_shares, commitments, rng=rng)
+
+        # Shareholders that take part in the reconstruction: the k-1 anchored
+        # keys plus the middle one of the others
+        quorum = np.append(np.sort(rank[:k - 1]), rank[k - 1 + (n - k + 1) // 2])
+
+        # Sizes shrink with the committee so labels keep to a few rows
+        dot_radius = float(np.clip(0.15 * np.sqrt(12 / n), 0.03, 0.15))
+        font_size = float(np.clip(1100 / n, 8, 16))
+
+        # --- SCENE 1: THE SECRET ---
+        self.next_section("The Secret")
+
+        axes = Axes(
+            x_range=[-4, 5, 1],
+            y_range=[-1, 10, 1],
+            y_length=5,
+            axis_config={"include_numbers": False, "color": GREY},
+            tips=True
+        ).shift(UP * 0.5)
+
+        secret_dot = Dot(axes.c2p(0, SECRET_Y), color=RED, radius=0.2).set_z_index(10)
+        # The restored label at the end repeats this text; it comes from the cache
+        secret_label = cached_text(f"Secret Value: {SECRET_Y}", font_size=36, color=RED).next_to(secret_dot, RIGHT)
+
+        self.play(Create(axes))
+        self.play(FadeIn(secret_dot), Write(secret_label))
+        self.wait(1)
+
+        # --- SCENE 2: THE LOCK ---
+        self.next_section("The Lock")
+
+        curve = plot_adaptive(axes, lock, x_range=span, color=BLUE, stroke_width=4)
+        curve_label = Text(f"Degree {k - 1} Lock", font_size=24, color=BLUE).to_corner(UR)
+
+        self.play(Create(curve), FadeIn(curve_label))
+        self.wait(1)
+
+        # --- SCENE 3: THE KEYS ---
+        self.next_section("The Keys")
+
+        share_points = to_scene_points(axes, share_x, share_y)
+        palette = [YELLOW, ORANGE, PURPLE]
+        color_ids = np.arange(n) % len(palette)
+        keys = DotCloud(share_points, palette, color_ids, radius=dot_radius).set_z_index(5)
+
+        # Labels sit in rows under the x-axis. Rows come from one sweep over
+        # the labels sorted by x instead of pairwise next_to checks.
+        key_labels = VGroup(*[
+            Text(f"P{i + 1}", font_size=font_size, color=palette[color_ids[i]])
+            for i in range(n)
+        ])
+        widths = np.array([lbl.width for lbl in key_labels])
+        tiers = stack_labels(share_points[:, 0] - widths / 2, share_points[:, 0] + widths / 2)
+        row_height = key_labels[0].height * 1.6
+        top = axes.c2p(0, -1)[1] - 0.3
+        for lbl, x, tier in zip(key_labels, share_points[:, 0], tiers):
+            lbl.move_to([x, top - tier * row_height, 0])
+
+        count_text = VGroup(
+            Text(f"{n} Shareholders, any {k} unlock", font_size=24),
+            Text(
+                f"All {n} keys checked in one batch: {'valid' if verified else 'INVALID'}",
+                font_size=18, color=GREEN if verified else RED
+            ),
+        ).arrange(DOWN, aligned_edge=LEFT, buff=0.1).to_corner(UL)
+
+        self.play(FadeIn(keys), Write(count_text))
+        self.play(FadeIn(key_labels))
+        self.wait(2)
+
+        # "Delete the secret"
+        self.play(
+            FadeOut(secret_dot),
+            FadeOut(secret_label),
+            FadeOut(curve),
+            FadeOut(curve_label),
+            FadeOut(count_text),
+        )
+        self.wait(1)
+
+        # --- SCENE 4: THE FAIL ---
+        self.next_section("The Fail")
+
+        known = quorum[:-1]
+        ring_style = {"radius": dot_radius * 1.8}
+        known_rings = DotCloud(share_points[known], [WHITE], **ring_style).set_opacity(0.5)
+
+        ghosts = GhostFamily(share_x[known], share_y[known])
+        guesses = SECRET_Y + np.linspace(-5, 8, 40)
+        # Guesses far from the secret leave the plot; clipping to the axes keeps
+        # them (and the band) in frame and the sampling finite
+        y_min, y_max = axes.y_range[:2]
+        ghost_ys = lambda x: np.clip(ghosts.evaluate(guesses, x), y_min, y_max)
+        sample_x = adaptive_xs(axes, ghost_ys, *span)
+        ghost_lines = VGroup(
+            band_between(
+                axes, sample_x, *np.clip(ghosts.band(guesses[0], guesses[-1], sample_x), y_min, y_max),
+                stroke_width=0, fill_color=GREY, fill_opacity=0.1
+            ),
+            curve_family(axes, sample_x, ghost_ys(sample_x), color=GREY, stroke_opacity=0.15)
+        )
+
+        fail_text = Text(f"{k - 1} Keys = Infinite Guesses", font_size=24, color=GREY).to_corner(UL)
+
+        self.play(FadeIn(known_rings))
+        self.play(Create(ghost_lines), run_time=2)
+        self.play(Write(fail_text))
+        self.wait(2)
+
+        # --- SCENE 5: SUCCESS ---
+        self.next_section("Success")
+
+        last_ring = DotCloud(share_points[quorum[-1:]], [WHITE], **ring_style).set_opacity(0.5)
+        self.play(FadeOut(ghost_lines), FadeOut(fail_text), FadeIn(last_ring))
+
+        # The quorum pins down exactly the lock again: the green curve and the
+        # number both come from interpolating the k drawn keys. k-1 of them are
+        # the lock's own Chebyshev nodes, so this stays well conditioned and
+        # lands on the secret even for a committee of hundreds.
+        rebuilt = Barycentric(share_x[quorum], share_y[quorum])
+        final_curve = plot_adaptive(axes, rebuilt, x_range=span, color=GREEN, stroke_width=5)
+        restored = round(float(rebuilt(np.zeros(1))[0]))
+        restored_label = cached_text(f"Secret Value: {restored}", font_size=36, color=RED).next_to(secret_dot, RIGHT)
+        success_text = Text(f"{k} Keys = Access Granted", font_size=24, color=GREEN).to_corner(UL)
+
+        self.play(Create(final_curve), run_time=2)
+        self.play(Write(success_text))
+
+        self.play(FadeIn(secret_dot), FadeIn(restored_label))
+        self.wait(3)
+
+class CommitteeThresholdStory(ThresholdStory):
+    # A realistic committee: any 67 of 200 shareholders
+    THRESHOLD = 67
+    SHAREHOLDERS = 200
@@ -0,0 +1,111 @@
+from manim import *
+import numpy as np
+
+import vss
+
+class VerifiableKeys(Scene):
+    # Feldman VSS: the dealer publishes commitments to the lock, every key is
+    # checked against them in one batch, and bisection finds the forged key.
+    THRESHOLD = 4
+    SHAREHOLDERS = 16
+    SECRET = 3
+    FORGED = 10
+    SEED = 11
+
+    def construct(self):
+        # --- CONFIGURATION ---
+        k, n = self.THRESHOLD, self.SHAREHOLDERS
+        rng = np.random.default_rng(self.SEED)
+        xs, shares, commitments = vss.deal(self.SECRET, k, n, rng=rng)
+
+        # One share is altered on its way to the shareholder
+        received = shares.copy()
+        received[self.FORGED] = (received[self.FORGED] + 1) % vss.Q
+        all_ok = vss.batch_verify(xs, received, commitments, rng=rng)
+        bad, rounds = vss.find_bad(xs, received, commitments, rng=rng)
+
+        title = Text("Verifiable Keys", font_size=40).to_edge(UP)
+        self.add(title)
+
+        # --- SCENE 1: THE COMMITMENTS ---
+        self.next_section("The Commitments")
+
+        boxes = VGroup()
+        for j, c in enumerate(commitments):
+            lbl = VGroup(
+                Text(f"C{j} = G^a{j}", font_size=20, color=BLUE),
+                Text(str(c), font_size=16, color=GRAY),
+            ).arrange(DOWN, buff=0.1)
+            box = SurroundingRectangle(lbl, color=BLUE, buff=0.15, corner_radius=0.1)
+            boxes.add(VGroup(box, lbl))
+        boxes.arrange(RIGHT, buff=0.4).shift(UP * 1.8)
+        dealer_text = Text("The dealer publishes one commitment per coefficient", font_size=24).to_edge(DOWN)
+
+        self.play(LaggedStart(*[FadeIn(b, shift=DOWN * 0.2) for b in boxes], lag_ratio=0.2), Write(dealer_text))
+        self.wait(1)
+
+        # --- SCENE 2: THE KEYS ---
+        self.next_section("The Keys")
+
+        tokens = VGroup()
+        for i in range(n):
+            square = Square(side_length=0.6, color=YELLOW, fill_opacity=0.2)
+            lbl = Text(f"P{i + 1}", font_size=16, color=YELLOW).move_to(square)
+            tokens.add(VGroup(square, lbl))
+        tokens.arrange(RIGHT, buff=0.15).shift(DOWN * 0.4)
+        keys_text = Text(f"{n} keys handed out, one altered on the way", font_size=24).to_edge(DOWN)
+
+        self.play(LaggedStart(*[FadeIn(t, shift=UP * 0.2) for t in tokens], lag_ratio=0.05))
+        self.play(ReplacementTransform(dealer_text, keys_text))
+        self.wait(1)
+
+        # --- SCENE 3: ONE CHECK ---
+        self.next_section("One Check")
+
+        brace = Brace(tokens, DOWN, color=GREY)
+        check = Text(
+            f"1 randomized check, {k + 1} bases: {'pass' if all_ok else 'FAIL'}",
+            font_size=24, color=GREEN if all_ok else RED
+        ).next_to(brace, DOWN)
+        naive = Text(
+            f"instead of {n} separate checks ({n * k} exponentiations)",
+            font_size=20, color=GRAY
+        ).next_to(check, DOWN)
+
+        self.play(FadeOut(keys_text), GrowFromCenter(brace))
+        self.play(Write(check), FadeIn(naive))
+        self.wait(2)
+
+        # --- SCENE 4: BISECTION ---
+        self.next_section("Bisection")
+
+        self.play(FadeOut(brace), FadeOut(check), FadeOut(naive))
+        frames = VGroup()
+        for round_ in rounds:
+            new_frames = VGroup(*[
+                SurroundingRectangle(tokens[lo:hi], color=GREEN if ok else RED, buff=0.06)
+                for lo, hi, ok in round_
+            ])
+            cleared = [
+                token[0].animate.set_color(GREEN)
+                for lo, hi, ok in round_ if ok for token in tokens[lo:hi]
+            ]
+            swap = [Create(new_frames)] + ([FadeOut(frames)] if frames else [])
+            self.play(*swap, run_time=0.6)
+            if cleared:
+                self.play(*cleared, run_time=0.4)
+            frames = new_frames
+
+        caught = VGroup(*[tokens[i] for i in bad])
+        caught_text = Text(
+            f"Forged key caught: P{', P'.join(str(i + 1) for i in bad)}",
+            font_size=28, color=RED
+        ).next_to(tokens, DOWN, buff=0.6)
+        tally = Text(
+            f"{sum(len(r) for r in rounds)} group checks in {len(rounds)} batched rounds",
+            font_size=20, color=GRAY
+        ).next_to(caught_text, DOWN)
+
+        self.play(FadeOut(frames), caught.animate.set_color(RED).scale(1.2))
+        self.play(Write(caught_text), FadeIn(tally))
+        self.wait(3)
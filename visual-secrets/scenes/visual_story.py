@@ -1,10 +1,17 @@
 from manim import *
 import numpy as np
 
+from scenekit.glyphs import cached_text
+
+import shamir_field
+from interpolation import GhostFamily
+from plotting import adaptive_xs, band_between, curve_family, plot_adaptive
+
 class VisualThresholdStory(Scene):
     def construct(self):
         # --- CONFIGURATION ---
         SECRET_Y = 3
+        VAULT_COEFFS = [SECRET_Y, -0.5, 0.15]
         def vault_curve(x):
             return SECRET_Y - 0.5 * x + 0.15 * x**2
 
@@ -29,7 +36,8 @@ class VisualThresholdStory(Scene):
 
         # 3. The Secret (Red Dot)
         secret_dot = Dot(axes.c2p(0, SECRET_Y), color=RED, radius=0.2).set_z_index(10)
-        secret_label = Text("Secret Value: 3", font_size=36, color=RED).next_to(secret_dot, RIGHT)
+        # The restored label at the end repeats this text; it comes from the cache
+        secret_label = cached_text("Secret Value: 3", font_size=36, color=RED).next_to(secret_dot, RIGHT)
         
         self.play(Create(axes), FadeIn(x_labels))
         self.play(FadeIn(secret_dot), Write(secret_label))
@@ -38,7 +46,7 @@ class VisualThresholdStory(Scene):
         # --- SCENE 2: THE LOCK ---
         self.next_section("The Lock")
         
-        curve = axes.plot(vault_curve, color=BLUE, stroke_width=4)
+        curve = plot_adaptive(axes, vault_curve, color=BLUE, stroke_width=4)
         curve_label = Text("Polynomial Lock", font_size=24, color=BLUE).to_corner(UR)
 
         self.play(Create(curve), FadeIn(curve_label))
@@ -64,6 +72,9 @@ class VisualThresholdStory(Scene):
             keys.add(dot)
             key_labels.add(lbl)
 
+        # The same keys as exact GF(p) shares, used for the real reconstruction
+        field_shares = shamir_field.share_points(VAULT_COEFFS, x_coords)
+
         self.play(LaggedStart(*[FadeIn(k) for k in keys], lag_ratio=0.5))
         self.play(Write(key_labels))
         self.wait(2)
@@ -89,18 +100,21 @@ class VisualThresholdStory(Scene):
         )
 
         # Ghost Curve Logic
-        def get_wobbly_curve(intercept_shift):
-            x1, y1 = x_coords[0], vault_curve(x_coords[0])
-            x2, y2 = x_coords[1], vault_curve(x_coords[1])
-            target_secret = SECRET_Y + intercept_shift
-            poly = np.polyfit([x1, x2, 0], [y1, y2, target_secret], 2)
-            return lambda x: poly[0]*x**2 + poly[1]*x + poly[2]
-
-        ghost_lines = VGroup()
-        for shift in [-5, -2, 2, 5, 8]:
-            func = get_wobbly_curve(shift)
-            graph = axes.plot(func, color=GREY, stroke_opacity=0.3)
-            ghost_lines.add(graph)
+        # Every quadratic through Alice and Bob, one per guessed secret.
+        # All of them come from a single solve and a single batched evaluation.
+        known_x = x_coords[:2]
+        ghosts = GhostFamily(known_x, [vault_curve(x) for x in known_x])
+        guesses = SECRET_Y + np.linspace(-5, 8, 40)
+        sample_x = adaptive_xs(axes, lambda x: ghosts.evaluate(guesses, x), -4, 5)
+
+        ghost_band = band_between(
+            axes, sample_x, *ghosts.band(guesses[0], guesses[-1], sample_x),
+            stroke_width=0, fill_color=GREY, fill_opacity=0.1
+        )
+        ghost_lines = VGroup(
+            ghost_band,
+            curve_family(axes, sample_x, ghosts.evaluate(guesses, sample_x), color=GREY, stroke_opacity=0.15)
+        )
 
         fail_text = Text("2 Keys = Infinite Guesses", font_size=24, color=GREY).to_corner(UL)
         
@@ -118,11 +132,15 @@ class VisualThresholdStory(Scene):
             FadeIn(key_labels[2])
         )
 
-        final_curve = axes.plot(vault_curve, color=GREEN, stroke_width=5)
+        final_curve = plot_adaptive(axes, vault_curve, color=GREEN, stroke_width=5)
         success_text = Text("3 Keys = Access Granted", font_size=24, color=GREEN).to_corner(UL)
 
+        # Exact Lagrange interpolation in GF(p), no floating point rounding
+        restored = shamir_field.reconstruct(x_coords, field_shares)
+        restored_label = cached_text(f"Secret Value: {restored}", font_size=36, color=RED).next_to(secret_dot, RIGHT)
+
         self.play(Create(final_curve), run_time=2)
         self.play(Write(success_text))
         
-        self.play(FadeIn(secret_dot), FadeIn(secret_label))
+        self.play(FadeIn(secret_dot), FadeIn(restored_label))
         self.wait(3)
\ No newline at end of file
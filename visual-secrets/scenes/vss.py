@@ -0,0 +1,154 @@
+import numpy as np
+
+import shamir_field
+
+# --- GROUP PARAMETERS ---
+# Feldman commitments live in the order-Q subgroup of Z_P^*, with P = 2Q + 1
+# a safe prime. P < 2^31 keeps every product of two group elements inside
+# int64, so commitments and checks stay in vectorized NumPy like the rest of
+# the field code. Shares are split over GF(Q), the exponent field.
+# Toy-sized like every other number in these scenes; the algebra is the same
+# with a 2048-bit group.
+Q = 1073741789
+P = 2 * Q + 1
+# Any square other than 1 generates the order-Q subgroup
+G = 4
+# Exponent bits consumed per step of the multi-exponentiation
+WINDOW = 4
+
+
+def power(bases, exponents):
+    # Elementwise bases ** exponents mod P, square-and-multiply over arrays
+    bases, exponents = np.broadcast_arrays(
+        np.asarray(bases, dtype=np.int64) % P, np.asarray(exponents, dtype=np.int64)
+    )
+    result = np.ones_like(bases)
+    bases, exponents = bases.copy(), exponents.copy()
+    while exponents.any():
+        result = np.where(exponents & 1, result * bases % P, result)
+        bases = bases * bases % P
+        exponents >>= 1
+    return result
+
+
+def _product(values):
+    # Product mod P along the last axis by pairwise halving
+    while values.shape[-1] > 1:
+        if values.shape[-1] % 2:
+            values = np.concatenate([values, np.ones_like(values[..., :1])], axis=-1)
+        values = values[..., 0::2] * values[..., 1::2] % P
+    return values[..., 0]
+
+
+def multi_exp(bases, exponents):
+    # prod_j bases[j] ** exponents[..., j] mod P for every row of exponents.
+    # Straus' simultaneous method: one small power table per base, then the
+    # squarings are shared by all bases instead of paid once per base.
+    bases = np.asarray(bases, dtype=np.int64) % P
+    exponents = np.asarray(exponents, dtype=np.int64) % Q
+    w = WINDOW
+    table = np.empty((len(bases), 2**w), dtype=np.int64)
+    table[:, 0] = 1
+    for d in range(1, 2**w):
+        table[:, d] = table[:, d - 1] * bases % P
+
+    columns = np.arange(len(bases))
+    acc = np.ones(exponents.shape[:-1], dtype=np.int64)
+    for shift in range((Q.bit_length() - 1) // w * w, -1, -w):
+        for _ in range(w):
+            acc = acc * acc % P
+        digits = (exponents >> shift) & (2**w - 1)
+        acc = acc * _product(table[columns, digits]) % P
+    return acc
+
+
+# --- DEALER ---
+def deal(secret, k, n, xs=None, rng=None):
+    # Shamir split of one secret over GF(Q) plus the public commitments
+    # C_j = G^a_j to every polynomial coefficient.
+    # Returns (xs, shares, commitments).
+    if not 1 <= k <= n:
+        raise ValueError(f"Need 1 <= k <= n, got k={k}, n={n}.")
+    if xs is None:
+        xs = np.arange(1, n + 1, dtype=np.int64)
+    xs = np.asarray(xs, dtype=np.int64) % Q
+    if len(xs) != n or len(np.unique(xs)) != n or np.any(xs == 0):
+        raise ValueError("Need n distinct, non-zero share x-coordinates.")
+
+    coeffs = np.empty((1, k), dtype=np.int64)
+    coeffs[0, 0] = shamir_field.to_field(secret, Q)
+    coeffs[0, 1:] = shamir_field.random_elements(k - 1, Q, rng)
+    shares = shamir_field.eval_polys(coeffs, xs, Q)[0]
+    return xs, shares, power(G, coeffs[0])
+
+
+# --- VERIFICATION ---
+def verify_share(x, share, commitments):
+    # The textbook check for one share: G^y == prod_j C_j^(x^j).
+    # k exponentiations per share, so n * k for a whole committee.
+    x_powers = np.array([pow(int(x), j, Q) for j in range(len(commitments))], dtype=np.int64)
+    expected = _product(power(commitments, x_powers))
+    return bool(power(G, share) == expected)
+
+
+def _batch_exponents(xs, shares, k, groups, rng):
+    # For every group (a 0/1 row over the shares) the exponents of one
+    # randomized check G^-(sum r_i y_i) * prod_j C_j^(sum r_i x_i^j) == 1.
+    # A bad share in a group slips through with probability 1/Q.
+    xs = np.asarray(xs, dtype=np.int64) % Q
+    shares = np.asarray(shares, dtype=np.int64) % Q
+    r = shamir_field.random_elements(len(xs), Q, rng)
+
+    # r_i * x_i^j, column by column; every term stays below Q < 2^30, so the
+    # group sums below fit int64 for any realistic committee
+    weighted = np.empty((len(xs), k), dtype=np.int64)
+    weighted[:, 0] = r
+    for j in range(1, k):
+        weighted[:, j] = weighted[:, j - 1] * xs % Q
+    groups = np.asarray(groups, dtype=np.int64)
+
+    exponents = np.empty((len(groups), k + 1), dtype=np.int64)
+    exponents[:, 0] = -(groups @ (r * shares % Q)) % Q
+    exponents[:, 1:] = groups @ weighted % Q
+    return exponents
+
+
+def batch_verify(xs, shares, commitments, groups=None, rng=None):
+    # One multi-exponentiation with k + 1 bases checks a whole group of
+    # shares at once. groups is an (m, n) 0/1 array of share subsets (all
+    # shares by default); returns a bool per group, or one bool.
+    single = groups is None
+    if single:
+        groups = np.ones((1, len(xs)), dtype=np.int64)
+    commitments = np.asarray(commitments, dtype=np.int64)
+    bases = np.concatenate([[G], commitments])
+    exponents = _batch_exponents(xs, shares, len(commitments), groups, rng)
+    ok = multi_exp(bases, exponents) == 1
+    return bool(ok[0]) if single else ok
+
+
+def find_bad(xs, shares, commitments, rng=None):
+    # Locate every bad share by bisection: each round re-checks the halves of
+    # the ranges that failed, all of them in one batched call. One bad share
+    # among n costs about 2 * log2(n) group checks instead of n single ones.
+    # Returns (bad indices, rounds) where each round lists (lo, hi, ok).
+    pending = [(0, len(xs))]
+    rounds = []
+    bad = []
+    while pending:
+        groups = np.zeros((len(pending), len(xs)), dtype=np.int64)
+        for row, (lo, hi) in enumerate(pending):
+            groups[row, lo:hi] = 1
+        ok = batch_verify(xs, shares, commitments, groups, rng)
+        rounds.append([(lo, hi, bool(passed)) for (lo, hi), passed in zip(pending, ok)])
+
+        pending = []
+        for lo, hi, passed in rounds[-1]:
+            if passed:
+                continue
+            if hi - lo == 1:
+                bad.append(lo)
+            else:
+                mid = (lo + hi) // 2
+                pending += [(lo, mid), (mid, hi)]
+    return bad, rounds